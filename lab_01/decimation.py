@@ -0,0 +1,64 @@
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+Points = tuple[NDArray[np.float64], NDArray[np.float64]]
+
+
+def minmax_decimate(
+    x_values: NDArray[np.float64], y_values: NDArray[np.float64], buckets: int
+) -> Points:
+    size = len(x_values)
+    if buckets <= 0 or size <= 2 * buckets:
+        return x_values, y_values
+
+    bucket_size = size // buckets
+    used = buckets * bucket_size
+    grouped = y_values[:used].reshape(buckets, bucket_size)
+
+    offsets = np.arange(buckets) * bucket_size
+    idx_min = grouped.argmin(axis=1) + offsets
+    idx_max = grouped.argmax(axis=1) + offsets
+
+    parts = [np.array([0, size - 1]), idx_min, idx_max]
+    if used < size:
+        tail = y_values[used:]
+        parts.append(np.array([tail.argmin(), tail.argmax()]) + used)
+
+    idx = np.unique(np.concatenate(parts))
+    return x_values[idx], y_values[idx]
+
+
+def lttb(
+    x_values: NDArray[np.float64], y_values: NDArray[np.float64], buckets: int
+) -> Points:
+    size = len(x_values)
+    if buckets < 3 or size <= buckets:
+        return x_values, y_values
+
+    edges = np.linspace(1, size - 1, buckets - 1).astype(np.intp)
+    idx = np.empty(buckets, dtype=np.intp)
+    idx[0], idx[-1] = 0, size - 1
+
+    for i in range(buckets - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else size
+
+        avg_x = x_values[end:next_end].mean()
+        avg_y = y_values[end:next_end].mean()
+        prev_x, prev_y = x_values[idx[i]], y_values[idx[i]]
+
+        area = np.abs(
+            (prev_x - avg_x) * (y_values[start:end] - prev_y)
+            - (prev_x - x_values[start:end]) * (avg_y - prev_y)
+        )
+        idx[i + 1] = start + area.argmax()
+
+    return x_values[idx], y_values[idx]
+
+
+DECIMATORS: dict[str, Callable[..., Points]] = {
+    "minmax": minmax_decimate,
+    "lttb": lttb,
+}
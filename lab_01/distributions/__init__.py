@@ -1,2 +1,5 @@
 from .uniform import *
 from .exponental import *
+from .base import *
+from .continuous import *
+from .empirical import *
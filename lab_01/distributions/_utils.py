@@ -0,0 +1,9 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+def unwrap(values: NDArray[np.float64]) -> float | NDArray[np.float64]:
+    if values.ndim == 0:
+        return float(values)
+
+    return values
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+__all__ = [
+    "Distribution",
+    "DISTRIBUTIONS",
+    "register",
+    "make_distribution",
+]
+
+_DEFAULT_RNG = np.random.default_rng()
+
+
+class Distribution(ABC):
+    @abstractmethod
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        raise NotImplementedError
+
+    def sample(
+        self, n: int, rng: np.random.Generator | None = None
+    ) -> NDArray[np.float64]:
+        rng = rng or _DEFAULT_RNG
+        return np.asarray(self.ppf(rng.random(n)), dtype=np.float64)
+
+
+DISTRIBUTIONS: dict[str, type[Distribution]] = {}
+
+
+def register(
+    name: str,
+) -> Callable[[type[Distribution]], type[Distribution]]:
+    def decorator(cls: type[Distribution]) -> type[Distribution]:
+        DISTRIBUTIONS[name] = cls
+        return cls
+
+    return decorator
+
+
+def make_distribution(name: str, *args, **kwargs) -> Distribution:
+    try:
+        cls = DISTRIBUTIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown distribution: {name!r}") from None
+
+    return cls(*args, **kwargs)
@@ -0,0 +1,184 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._utils import unwrap
+from .base import Distribution, register
+from .exponental import exp_cdf, exp_pdf
+from .uniform import uniform_cdf, uniform_pdf
+
+__all__ = [
+    "Uniform",
+    "Exponential",
+    "Normal",
+    "Gamma",
+    "Erlang",
+    "Triangular",
+]
+
+
+@register("uniform")
+class Uniform(Distribution):
+    def __init__(self, a: float, b: float) -> None:
+        if not a < b:
+            raise ValueError("Uniform distribution requires a < b")
+
+        self._a = a
+        self._b = b
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        return uniform_pdf(x, self._a, self._b)
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        return uniform_cdf(x, self._a, self._b)
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        q = np.asarray(q, dtype=np.float64)
+        return unwrap(self._a + (self._b - self._a) * q)
+
+
+@register("exp")
+class Exponential(Distribution):
+    def __init__(self, lambda_: float) -> None:
+        if lambda_ <= 0:
+            raise ValueError("Exponential distribution requires lambda > 0")
+
+        self._lambda = lambda_
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        return exp_pdf(x, self._lambda)
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        return exp_cdf(x, self._lambda)
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        q = np.asarray(q, dtype=np.float64)
+        return unwrap(-np.log1p(-q) / self._lambda)
+
+
+@register("normal")
+class Normal(Distribution):
+    def __init__(self, mu: float = 0.0, sigma: float = 1.0) -> None:
+        if sigma <= 0:
+            raise ValueError("Normal distribution requires sigma > 0")
+
+        self._mu = mu
+        self._sigma = sigma
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        z = (np.asarray(x, dtype=np.float64) - self._mu) / self._sigma
+        return unwrap(np.exp(-0.5 * z * z) / (self._sigma * np.sqrt(2 * np.pi)))
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        from scipy import special
+
+        z = (np.asarray(x, dtype=np.float64) - self._mu) / self._sigma
+        return unwrap(special.ndtr(z))
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        from scipy import special
+
+        q = np.asarray(q, dtype=np.float64)
+        return unwrap(self._mu + self._sigma * special.ndtri(q))
+
+
+@register("gamma")
+class Gamma(Distribution):
+    def __init__(self, k: float, lambda_: float) -> None:
+        if k <= 0 or lambda_ <= 0:
+            raise ValueError("Gamma distribution requires k > 0, lambda > 0")
+
+        self._k = k
+        self._lambda = lambda_
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        from scipy import special
+
+        x = np.asarray(x, dtype=np.float64)
+        positive = np.maximum(x, np.finfo(np.float64).tiny)
+
+        log_pdf = (
+            self._k * np.log(self._lambda)
+            + (self._k - 1) * np.log(positive)
+            - self._lambda * positive
+            - special.gammaln(self._k)
+        )
+        # the density at 0 is lambda for k = 1 and diverges for k < 1
+        at_zero = 0.0
+        if self._k == 1:
+            at_zero = self._lambda
+        elif self._k < 1:
+            at_zero = np.inf
+        return unwrap(
+            np.select([x > 0, x == 0], [np.exp(log_pdf), at_zero], 0.0)
+        )
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        from scipy import special
+
+        x = np.asarray(x, dtype=np.float64)
+        return unwrap(
+            special.gammainc(self._k, self._lambda * np.maximum(x, 0))
+        )
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        from scipy import special
+
+        q = np.asarray(q, dtype=np.float64)
+        return unwrap(special.gammaincinv(self._k, q) / self._lambda)
+
+
+@register("erlang")
+class Erlang(Gamma):
+    def __init__(self, k: int, lambda_: float) -> None:
+        if int(k) != k:
+            raise ValueError("Erlang distribution requires integer k")
+
+        super().__init__(int(k), lambda_)
+
+
+@register("triangular")
+class Triangular(Distribution):
+    def __init__(self, a: float, c: float, b: float) -> None:
+        if not (a <= c <= b and a < b):
+            raise ValueError("Triangular distribution requires a <= c <= b")
+
+        self._a = a
+        self._c = c
+        self._b = b
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        x = np.asarray(x, dtype=np.float64)
+        a, c, b = self._a, self._c, self._b
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = 2 * (x - a) / ((b - a) * (c - a))
+            falling = 2 * (b - x) / ((b - a) * (b - c))
+
+        result = np.select(
+            [(x < a) | (x > b), x < c, x == c],
+            [0.0, rising, 2 / (b - a)],
+            falling,
+        )
+        return unwrap(result)
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        x = np.clip(np.asarray(x, dtype=np.float64), self._a, self._b)
+        a, c, b = self._a, self._c, self._b
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = (x - a) ** 2 / ((b - a) * (c - a))
+            falling = 1 - (b - x) ** 2 / ((b - a) * (b - c))
+
+        return unwrap(np.where(x <= c, np.nan_to_num(rising), falling))
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        q = np.asarray(q, dtype=np.float64)
+        a, c, b = self._a, self._c, self._b
+        split = (c - a) / (b - a)
+
+        result = np.where(
+            q < split,
+            a + np.sqrt(q * (b - a) * (c - a)),
+            b - np.sqrt((1 - q) * (b - a) * (b - c)),
+        )
+        return unwrap(result)
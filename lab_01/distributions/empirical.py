@@ -0,0 +1,41 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._utils import unwrap
+from .base import Distribution, register
+
+__all__ = ["Empirical"]
+
+
+@register("empirical")
+class Empirical(Distribution):
+    def __init__(self, data: ArrayLike) -> None:
+        values, counts = np.unique(
+            np.asarray(data, dtype=np.float64), return_counts=True
+        )
+        if len(values) < 2:
+            raise ValueError(
+                "Empirical distribution requires at least two distinct values"
+            )
+
+        self._x = values
+        self._p = (np.cumsum(counts) - 1) / (counts.sum() - 1)
+        self._density = np.diff(self._p) / np.diff(self._x)
+
+    def pdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        x = np.asarray(x, dtype=np.float64)
+        idx = np.searchsorted(self._x, x, side="right") - 1
+
+        inside = (idx >= 0) & (idx < len(self._density))
+        result = np.where(
+            inside, self._density[np.clip(idx, 0, len(self._density) - 1)], 0
+        )
+        return unwrap(result.astype(np.float64))
+
+    def cdf(self, x: float | ArrayLike) -> float | NDArray[np.float64]:
+        x = np.asarray(x, dtype=np.float64)
+        return unwrap(np.interp(x, self._x, self._p, left=0.0, right=1.0))
+
+    def ppf(self, q: float | ArrayLike) -> float | NDArray[np.float64]:
+        q = np.asarray(q, dtype=np.float64)
+        return unwrap(np.interp(q, self._p, self._x))
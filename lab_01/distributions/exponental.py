@@ -1,19 +1,32 @@
-import math
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
+from ._utils import unwrap
 
-def exp_cdf(x: float, lambda_: float) -> float:
-    if x < 0.0:
-        result = 0.0
-    else:
-        result = 1 - math.exp(-lambda_ * x)
+__all__ = ["exp_cdf", "exp_pdf"]
 
-    return result
 
+def exp_cdf(
+    x: float | ArrayLike, lambda_: float
+) -> float | NDArray[np.float64]:
+    result = np.array(x, dtype=np.float64)
+    np.maximum(result, 0.0, out=result)
+    result *= -lambda_
+    np.exp(result, out=result)
+    np.subtract(1, result, out=result)
 
-def exp_pdf(x: float, lambda_: float) -> float:
-    if x < 0:
-        result = 0.0
-    else:
-        result = lambda_ * math.exp(-lambda_ * x)
+    return unwrap(result)
 
-    return result
+
+def exp_pdf(
+    x: float | ArrayLike, lambda_: float
+) -> float | NDArray[np.float64]:
+    result = np.array(x, dtype=np.float64)
+    negative = result < 0.0
+    result[negative] = 0.0
+    result *= -lambda_
+    np.exp(result, out=result)
+    result *= lambda_
+    result[negative] = 0.0
+
+    return unwrap(result)
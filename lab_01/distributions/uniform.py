@@ -1,18 +1,28 @@
-def uniform_cdf(x: float, a: float, b: float) -> float:
-    if x >= b:
-        result = 1.0
-    elif x < a:
-        result = 0.0
-    else:
-        result = (x - a) / (b - a)
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
-    return result
+from ._utils import unwrap
 
+__all__ = ["uniform_cdf", "uniform_pdf"]
 
-def uniform_pdf(x: float, a: float, b: float) -> float:
-    if a <= x <= b:
-        result = 1 / (b - a)
-    else:
-        result = 0
 
-    return result
+def uniform_cdf(
+    x: float | ArrayLike, a: float, b: float
+) -> float | NDArray[np.float64]:
+    result = np.array(x, dtype=np.float64)
+    result -= a
+    result /= b - a
+    np.clip(result, 0.0, 1.0, out=result)
+
+    return unwrap(result)
+
+
+def uniform_pdf(
+    x: float | ArrayLike, a: float, b: float
+) -> float | NDArray[np.float64]:
+    x = np.asarray(x, dtype=np.float64)
+
+    result = np.zeros(x.shape)
+    result[(a <= x) & (x <= b)] = 1 / (b - a)
+
+    return unwrap(result)
@@ -1,24 +1,32 @@
-from collections.abc import Iterable
 from typing import Literal
 
 import click
-import matplotlib.pyplot as plt
 import numpy as np
+from numpy.typing import NDArray
 
-from distributions import uniform_cdf, uniform_pdf, exp_cdf, exp_pdf
+from decimation import DECIMATORS
+from distributions import Distribution, Exponential, Uniform
+from storage import save_grids
+from streaming import grid_size, iter_grid
 
 
 def draw_graphics(
-    x_values: Iterable[float],
-    cdf_values: Iterable[float],
-    pdf_values: Iterable[float],
+    x_values: NDArray[np.float64],
+    cdf_values: NDArray[np.float64],
+    pdf_values: NDArray[np.float64],
     title: str,
+    decimation: str = "minmax",
 ) -> None:
+    import matplotlib.pyplot as plt
+
     fig, axs = plt.subplots(2, figsize=(6, 7))
 
+    decimate = DECIMATORS[decimation]
+    buckets = int(fig.get_figwidth() * fig.dpi)
+
     fig.suptitle(title)
-    axs[0].plot(x_values, cdf_values, color="green")
-    axs[1].plot(x_values, pdf_values, color="green")
+    axs[0].plot(*decimate(x_values, cdf_values, buckets), color="green")
+    axs[1].plot(*decimate(x_values, pdf_values, buckets), color="green")
 
     axs[0].set_xlabel("x")
     axs[0].set_ylabel("F(x)")
@@ -31,38 +39,18 @@ def draw_graphics(
     plt.show()
 
 
-def process_uniform(
-    x_values: Iterable[float],
-    a: float,
-    b: float,
-) -> tuple[list[float], list[float]]:
-    cdf_res: list[float] = []
-    pdf_res: list[float] = []
-
-    for x in x_values:
-        cdf_res.append(uniform_cdf(x, a, b))
-        pdf_res.append(uniform_pdf(x, a, b))
-
-    return cdf_res, pdf_res
-
-
-def process_expo(
-    x_values: Iterable[float],
-    lambda_: float,
-) -> tuple[list[float], list[float]]:
-    cdf_res: list[float] = []
-    pdf_res: list[float] = []
-
-    for x in x_values:
-        cdf_res.append(exp_cdf(x, lambda_))
-        pdf_res.append(exp_pdf(x, lambda_))
+def generate_x_values(
+    start: float, end: float, step: float = 1e-3
+) -> NDArray[np.float64]:
+    delta = end - start
+    return np.arange(start - delta / 2, end + delta / 2, step)
 
-    return cdf_res, pdf_res
 
+def read_param(value: float | None, prompt: str) -> float:
+    if value is not None:
+        return value
 
-def generate_x_values(start: float, end: float, step: float = 1e-3):
-    delta = end - start
-    return np.arange(start - delta / 2, end + delta / 2, step)
+    return float(input(prompt))
 
 
 @click.command()
@@ -71,7 +59,36 @@ def generate_x_values(start: float, end: float, step: float = 1e-3):
     required=True,
     help="Distribution kind ('uniform' or 'exp')",
 )
-def main(distribution: Literal["uniform"] | Literal["exp"]) -> None:
+@click.option("-a", type=float, default=None, help="a param")
+@click.option("-b", type=float, default=None, help="b param")
+@click.option("-lambda_value", type=float, default=None, help="lambda param")
+@click.option(
+    "-step",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1e-3,
+    help="Grid step",
+)
+@click.option(
+    "-output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write grids to .npy/.npz instead of drawing them",
+)
+@click.option(
+    "-decimation",
+    type=click.Choice(sorted(DECIMATORS)),
+    default="minmax",
+    help="Plot downsampling method",
+)
+def main(
+    distribution: Literal["uniform"] | Literal["exp"],
+    a: float | None,
+    b: float | None,
+    lambda_value: float | None,
+    step: float,
+    output: str | None,
+    decimation: str,
+) -> None:
     if distribution not in ("uniform", "exp"):
         click.secho(
             "\nУкажите верный тип распределения (см. --help)",
@@ -80,28 +97,48 @@ def main(distribution: Literal["uniform"] | Literal["exp"]) -> None:
         )
         return
 
-    a = float(input("Введите a: "))
-    b = float(input("Введите b: "))
+    if output is not None and (
+        a is None
+        or b is None
+        or (distribution == "exp" and lambda_value is None)
+    ):
+        click.secho(
+            "\nДля записи в файл укажите все параметры (см. --help)",
+            fg="red",
+            bold=True,
+        )
+        return
+
+    a = read_param(a, "Введите a: ")
+    b = read_param(b, "Введите b: ")
+
+    model: Distribution
+    try:
+        if distribution == "exp":
+            lambda_ = read_param(lambda_value, "Введите параметр lambda: ")
+            model = Exponential(lambda_)
+            title = "Экспоненциальное распределение"
+        else:
+            model = Uniform(a, b)
+            title = "Равномерное распределение"
+    except ValueError as error:
+        click.secho(f"\n{error}", fg="red", bold=True)
+        return
 
-    x_values = generate_x_values(a, b)
+    if output is not None:
+        save_grids(output, iter_grid(model, a, b, step), grid_size(a, b, step))
+        return
 
-    if distribution == "exp":
-        lambda_ = float(input("Введите параметр lambda: "))
-        expo_cdf_res, expo_pdf_res = process_expo(x_values, lambda_)
-        draw_graphics(
-            x_values,
-            cdf_values=expo_cdf_res,
-            pdf_values=expo_pdf_res,
-            title="Экспоненциальное распределение",
-        )
-    else:
-        uniform_cdf_res, uniform_pdf_res = process_uniform(x_values, a, b)
-        draw_graphics(
-            x_values,
-            cdf_values=uniform_cdf_res,
-            pdf_values=uniform_pdf_res,
-            title="Равномерное распределение",
-        )
+    x_values = generate_x_values(a, b, step)
+    cdf_res, pdf_res = model.cdf(x_values), model.pdf(x_values)
+
+    draw_graphics(
+        x_values,
+        cdf_values=cdf_res,
+        pdf_values=pdf_res,
+        title=title,
+        decimation=decimation,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import tempfile
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from streaming import GridChunk
+
+GRID_NAMES = ("x", "cdf", "pdf")
+COPY_BLOCK = 1 << 24
+
+
+def _write_rows(
+    file: BinaryIO, chunks: Iterable[GridChunk], size: int, dtype: np.dtype
+) -> None:
+    data_start = file.tell()
+    file.truncate(data_start + 3 * size * dtype.itemsize)
+
+    offset = 0
+    for chunk in chunks:
+        for row, values in enumerate(chunk):
+            file.seek(data_start + (row * size + offset) * dtype.itemsize)
+            file.write(np.ascontiguousarray(values, dtype=dtype).data)
+        offset += len(chunk[0])
+
+
+def _save_npz(path: Path, chunks: Iterable[GridChunk], size: int) -> None:
+    dtype = np.dtype(np.float64)
+    row_bytes = size * dtype.itemsize
+
+    # the chunks arrive interleaved but the archive members are written one
+    # after another, so the rows are spilled to disk first
+    with tempfile.TemporaryFile() as spill:
+        _write_rows(spill, chunks, size, dtype)
+
+        with zipfile.ZipFile(path, "w", allowZip64=True) as archive:
+            for row, name in enumerate(GRID_NAMES):
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as out:
+                    npy_format.write_array_header_1_0(
+                        out,
+                        {
+                            "descr": dtype.str,
+                            "fortran_order": False,
+                            "shape": (size,),
+                        },
+                    )
+                    spill.seek(row * row_bytes)
+                    for start in range(0, row_bytes, COPY_BLOCK):
+                        out.write(
+                            spill.read(min(COPY_BLOCK, row_bytes - start))
+                        )
+
+
+def save_grids(
+    path: str | Path, chunks: Iterable[GridChunk], size: int
+) -> Path:
+    path = Path(path)
+
+    if path.suffix == ".npz":
+        _save_npz(path, chunks, size)
+        return path
+
+    path = path.with_suffix(".npy")
+    dtype = np.dtype(np.float64)
+
+    with open(path, "wb") as file:
+        npy_format.write_array_header_1_0(
+            file,
+            {"descr": dtype.str, "fortran_order": False, "shape": (3, size)},
+        )
+        _write_rows(file, chunks, size, dtype)
+
+    return path
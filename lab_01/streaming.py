@@ -0,0 +1,59 @@
+import math
+from collections.abc import Callable, Iterable, Iterator
+from functools import reduce
+from typing import TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from distributions import Distribution
+
+CHUNK_SIZE = 1 << 20
+
+T = TypeVar("T")
+GridChunk = tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+
+
+def _grid_bounds(start: float, end: float) -> tuple[float, float]:
+    delta = end - start
+    return start - delta / 2, end + delta / 2
+
+
+def grid_size(start: float, end: float, step: float = 1e-3) -> int:
+    low, high = _grid_bounds(start, end)
+    return max(math.ceil((high - low) / step), 0)
+
+
+def iter_x_values(
+    start: float,
+    end: float,
+    step: float = 1e-3,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[NDArray[np.float64]]:
+    low, _ = _grid_bounds(start, end)
+    size = grid_size(start, end, step)
+    # the same spacing np.arange uses, so chunks match generate_x_values
+    delta = (low + step) - low
+
+    for offset in range(0, size, chunk_size):
+        idx = np.arange(offset, min(offset + chunk_size, size))
+        yield low + idx * delta
+
+
+def iter_grid(
+    distribution: Distribution,
+    start: float,
+    end: float,
+    step: float = 1e-3,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[GridChunk]:
+    for x_values in iter_x_values(start, end, step, chunk_size):
+        yield x_values, distribution.cdf(x_values), distribution.pdf(x_values)
+
+
+def reduce_grid(
+    chunks: Iterable[GridChunk],
+    reducer: Callable[[T, GridChunk], T],
+    initial: T,
+) -> T:
+    return reduce(reducer, chunks, initial)
@@ -1,75 +1,468 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from threading import Event
+
+import numpy as np
+import scipy
 from numpy import linalg
+from numpy.typing import NDArray
+from scipy import linalg as scipy_linalg
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from cache import ResultsCache, matrix_key, results_cache
+from decomposition import ChainStructure, absorption_probabilities, decompose
 
-TIME_DELTA = 1e-3
 EPS = 1e-5
+MAX_TIME = 1e4
+TIME_GRID_POINTS = 64
+TRAJECTORY_SIZE = 1 << 23
+
+SPARSE_STATE_COUNT = 500
+# LU fill-in on unstructured chains makes spsolve impractical past this
+ITERATIVE_STATE_COUNT = 2000
+SOLVER_TOL = 1e-12
+SOLVER_MAX_ITER = 100_000
+GMRES_RESTART = 30
+GMRES_MAX_RESTARTS = 100
+PARALLEL_STATE_COUNT = 2000
+
+Matrix = list[list[float]] | NDArray[np.float64] | sparse.spmatrix
+
+# gmres takes rtol= from scipy 1.12 on and only tol= before that
+_GMRES_TOL_ARG = (
+    "rtol"
+    if tuple(map(int, scipy.__version__.split(".")[:2])) >= (1, 12)
+    else "tol"
+)
+
 
+class CalculationCancelled(Exception):
+    pass
 
-def _create_coef_matrix(matrix: list[list[float]]) -> list[list[float]]:
-    count = len(matrix)
 
-    res = [[0.0 for _ in range(count)] for _ in range(count)]
+def _create_coef_matrix(
+    matrix: Matrix,
+) -> NDArray[np.float64] | sparse.csr_matrix:
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+        off_diag = matrix - sparse.diags(matrix.diagonal())
+        out_rates = np.asarray(off_diag.sum(axis=1)).ravel()
+        return (off_diag.T - sparse.diags(out_rates)).tocsr()
 
-    for i in range(count):
-        for j in range(count):
-            value = -sum(matrix[i]) + matrix[i][i] if i == j else matrix[j][i]
-            res[i][j] = value
+    matrix = np.asarray(matrix, dtype=np.float64)
+    res = matrix.T.copy()
+    # cumsum keeps the left-to-right order of the former sum(matrix[i])
+    row_sums = np.cumsum(matrix, axis=1)[:, -1]
+    np.fill_diagonal(res, -row_sums + matrix.diagonal())
 
     return res
 
 
 def _fill_last_row(
-    matrix: list[list[float]], value: float
-) -> list[list[float]]:
-    matrix[-1] = [value] * len(matrix)
+    matrix: NDArray[np.float64], value: float
+) -> NDArray[np.float64]:
+    matrix[-1] = value
     return matrix
 
 
-def calculate_probability(matrix: list[list[float]]) -> list[float]:
-    count = len(matrix)
+def _solve_power(generator: sparse.csr_matrix) -> NDArray[np.float64]:
+    count = generator.shape[0]
+    # uniformization: p <- p + Qp / rate is a stochastic, aperiodic step
+    rate = 1.05 * max(-generator.diagonal().min(), np.finfo(float).tiny)
+
+    prob = np.full(count, 1.0 / count)
+    for _ in range(SOLVER_MAX_ITER):
+        prob_next = prob + generator @ prob / rate
+        prob_next /= prob_next.sum()
+        if np.abs(prob_next - prob).sum() < SOLVER_TOL:
+            return prob_next
+        prob = prob_next
+
+    return prob
+
+
+def _solve_direct(generator: sparse.csr_matrix) -> NDArray[np.float64]:
+    # pin the last state to 1 and drop its balance equation instead of
+    # bordering the matrix with a dense row of ones, which destroys sparsity
+    reduced = generator[:-1, :-1].tocsc()
+    ordinate_values = -generator[:-1, -1].toarray().ravel()
+
+    prob = np.append(sparse_linalg.spsolve(reduced, ordinate_values), 1.0)
+    return prob / prob.sum()
 
-    coef_matrix = _create_coef_matrix(matrix)
-    _fill_last_row(coef_matrix, 1.0)
 
-    ordinate_values = [0 if i != count - 1 else 1 for i in range(count)]
-    return linalg.solve(coef_matrix, ordinate_values).tolist()
+def _solve_gmres(generator: sparse.csr_matrix) -> NDArray[np.float64]:
+    count = generator.shape[0]
+    ones_row = sparse.csr_matrix(np.ones((1, count)))
+    coef_matrix = sparse.vstack([generator[:-1], ones_row], format="csr")
 
+    ordinate_values = np.zeros(count)
+    ordinate_values[-1] = 1.0
 
-def _calculate_probability_delta(
-    matrix: list[list[float]],
-    curr_prob: list[float],
+    diagonal = coef_matrix.diagonal()
+    diagonal[diagonal == 0] = 1.0
+
+    prob, info = sparse_linalg.gmres(
+        coef_matrix,
+        ordinate_values,
+        M=sparse.diags(1.0 / diagonal),
+        **{_GMRES_TOL_ARG: SOLVER_TOL},
+        restart=GMRES_RESTART,
+        maxiter=GMRES_MAX_RESTARTS,
+    )
+    if info != 0:
+        raise RuntimeError(f"GMRES did not converge in {info} iterations")
+
+    return prob
+
+
+def calculate_probability(
+    matrix: Matrix,
+    method: str = "auto",
+    cache: ResultsCache | None = results_cache,
 ) -> list[float]:
-    count = len(matrix)
+    if cache is None:
+        return _calculate_probability(matrix, method)
+
+    key = matrix_key(matrix, "probability", method, SOLVER_TOL)
+    prob = cache.get(key)
+    if prob is None:
+        prob = tuple(_calculate_probability(matrix, method))
+        cache.put(key, prob)
+
+    return list(prob)
+
+
+def _calculate_probability(matrix: Matrix, method: str) -> list[float]:
+    structure = decompose(matrix)
+    if structure.irreducible:
+        return _solve_irreducible(matrix, method)
+
+    return _solve_reducible(matrix, structure, method).tolist()
+
 
-    prob_delta: list[float] = []
-    coef_matrix = _create_coef_matrix(matrix)
+def _solve_reducible(
+    matrix: Matrix, structure: ChainStructure, method: str
+) -> NDArray[np.float64]:
+    rates = sparse.csr_matrix(matrix, dtype=np.float64)
+    count = rates.shape[0]
 
-    for i in range(count):
-        for j in range(count):
-            coef_matrix[i][j] *= curr_prob[j]
+    blocks = [rates[states][:, states] for states in structure.closed]
+    if not sparse.issparse(matrix):
+        blocks = [block.toarray() for block in blocks]
 
-        prob_delta.append(sum(coef_matrix[i]) * TIME_DELTA)
+    workers = min(len(blocks), os.cpu_count() or 1)
+    sizes = [len(states) for states in structure.closed]
+    if workers > 1 and sum(sizes) >= PARALLEL_STATE_COUNT:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            class_probs = list(
+                pool.map(_solve_irreducible, blocks, repeat(method))
+            )
+    else:
+        class_probs = [_solve_irreducible(block, method) for block in blocks]
 
-    return prob_delta
+    # the chain starts uniformly, as in calculate_time, and each closed
+    # class keeps the mass that gets absorbed into it
+    prob_start = np.full(count, 1.0 / count)
+    absorption = absorption_probabilities(rates, structure)
+    mass = prob_start[structure.transient] @ absorption
+    mass += [prob_start[states].sum() for states in structure.closed]
+
+    prob = np.zeros(count)
+    for states, class_prob, class_mass in zip(
+        structure.closed, class_probs, mass
+    ):
+        prob[states] = class_mass * np.asarray(class_prob)
+
+    return prob
+
+
+def _solve_irreducible(matrix: Matrix, method: str) -> list[float]:
+    count = len(matrix) if isinstance(matrix, list) else matrix.shape[0]
+
+    if method == "dense" or (
+        method == "auto"
+        and not sparse.issparse(matrix)
+        and count < SPARSE_STATE_COUNT
+    ):
+        if sparse.issparse(matrix):
+            matrix = matrix.toarray()
+        coef_matrix = _fill_last_row(_create_coef_matrix(matrix), 1.0)
+
+        ordinate_values = np.zeros(count)
+        ordinate_values[-1] = 1.0
+        return linalg.solve(coef_matrix, ordinate_values).tolist()
+
+    generator = _create_coef_matrix(sparse.csr_matrix(matrix))
+
+    match method:
+        case "auto" if count >= ITERATIVE_STATE_COUNT:
+            try:
+                prob = _solve_gmres(generator)
+            except RuntimeError:
+                prob = _solve_power(generator)
+        case "auto" | "direct":
+            prob = _solve_direct(generator)
+        case "gmres":
+            prob = _solve_gmres(generator)
+        case "power":
+            prob = _solve_power(generator)
+        case _:
+            raise ValueError(f"Unknown solver method: {method!r}")
+
+    return prob.tolist()
+
+
+def _trajectory(
+    generator: NDArray[np.float64] | sparse.csr_matrix,
+    prob_start: NDArray[np.float64],
+    duration: float,
+    points: int,
+) -> NDArray[np.float64]:
+    if sparse.issparse(generator):
+        return sparse_linalg.expm_multiply(
+            generator,
+            prob_start,
+            start=0.0,
+            stop=duration,
+            num=points + 1,
+            endpoint=True,
+        )
+
+    transition = scipy_linalg.expm(generator * (duration / points))
+    trajectory = np.empty((points + 1, len(prob_start)))
+    trajectory[0] = prob_start
+    for k in range(points):
+        trajectory[k + 1] = transition @ trajectory[k]
+
+    return trajectory
+
+
+def _final_entries(
+    deviation: NDArray[np.float64],
+) -> tuple[NDArray[np.bool_], NDArray[np.float64]]:
+    # the settling time is the start of the final stay inside the EPS band:
+    # for every state with a grid point outside the band, interpolate the
+    # entry that follows the last such point (inf if it is still outside)
+    outside = np.abs(deviation) > EPS
+    left = outside.any(axis=0)
+    last = len(deviation) - 1 - outside[::-1].argmax(axis=0)
+
+    states = np.arange(deviation.shape[1])
+    following = np.minimum(last + 1, len(deviation) - 1)
+    fraction = _entry_fraction(
+        deviation[last, states], deviation[following, states]
+    )
+    offset = np.where(outside[-1], np.inf, last + fraction)
+    return left, offset
+
+
+def _entry_fraction(
+    before: NDArray[np.float64], after: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    boundary = np.copysign(EPS, before)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = (before - boundary) / (before - after)
+
+    return np.clip(np.nan_to_num(fraction), 0.0, 1.0)
 
 
 def calculate_time(
-    matrix: list[list[float]],
+    matrix: Matrix,
     prob: list[float],
+    max_time: float = MAX_TIME,
+    progress: Callable[[float, int], None] | None = None,
+    cancel: Event | None = None,
+    cache: ResultsCache | None = results_cache,
 ) -> list[float]:
-    count = len(matrix)
+    if cache is None:
+        return _calculate_time(matrix, prob, max_time, progress, cancel)
+
+    key = matrix_key(
+        matrix, "time", tuple(prob), max_time, EPS, TIME_GRID_POINTS
+    )
+    time = cache.get(key)
+    if time is None:
+        time = tuple(_calculate_time(matrix, prob, max_time, progress, cancel))
+        cache.put(key, time)
 
+    return list(time)
+
+
+def _calculate_time(
+    matrix: Matrix,
+    prob: list[float],
+    max_time: float,
+    progress: Callable[[float, int], None] | None,
+    cancel: Event | None,
+) -> list[float]:
+    count = len(matrix) if isinstance(matrix, list) else matrix.shape[0]
+
+    if sparse.issparse(matrix) or count >= SPARSE_STATE_COUNT:
+        matrix = sparse.csr_matrix(matrix)
+    generator = _create_coef_matrix(matrix)
+
+    prob_target = np.asarray(prob, dtype=np.float64)
+    prob_curr = np.full(count, 1.0 / count)
+    time = np.full(count, np.inf)
+
+    time[np.abs(prob_curr - prob_target) <= EPS] = 0.0
+    # a state is settled once it has stayed in the band for a whole window;
+    # windows double, so that stay outlasts the time already simulated
+    settled = np.zeros(count, dtype=bool)
+
+    points = int(np.clip(TRAJECTORY_SIZE // count, 4, TIME_GRID_POINTS))
+    max_rate = -generator.diagonal().min()
+    window = 1.0 / max_rate if max_rate > 0 else max_time
     time_curr = 0.0
-    prob_curr: list[float] = [1.0 / count] * count
-    time: list[float] = [0.0] * count
 
-    while not all(time):
-        prob_delta = _calculate_probability_delta(matrix, prob_curr)
+    while not settled.all() and time_curr < max_time:
+        window = min(window, max_time - time_curr)
+        trajectory = _trajectory(generator, prob_curr, window, points)
+
+        left, offset = _final_entries(trajectory - prob_target)
+        time[left] = time_curr + offset[left] * window / points
+        settled = ~left
+
+        prob_curr = trajectory[-1]
+        time_curr += window
+        window *= 2
+
+        if progress is not None:
+            progress(time_curr, int(settled.sum()))
+        if cancel is not None and cancel.is_set():
+            raise CalculationCancelled
+
+    return time.tolist()
+
+
+def _create_coef_batch(matrices: NDArray[np.float64]) -> NDArray[np.float64]:
+    diag = np.arange(matrices.shape[-1])
+
+    res = matrices.transpose(0, 2, 1).copy()
+    row_sums = np.cumsum(matrices, axis=2)[..., -1]
+    res[:, diag, diag] = -row_sums + matrices[:, diag, diag]
+
+    return res
+
+
+def calculate_probability_batch(
+    matrices: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    matrices = np.asarray(matrices, dtype=np.float64)
+    batch_size, count, _ = matrices.shape
+
+    coef_matrices = _create_coef_batch(matrices)
+    coef_matrices[:, -1, :] = 1.0
+
+    ordinate_values = np.zeros((batch_size, count, 1))
+    ordinate_values[:, -1] = 1.0
+
+    try:
+        return np.linalg.solve(coef_matrices, ordinate_values)[..., 0]
+    except linalg.LinAlgError:
+        pass
+
+    # reducible chains have no unique stationary vector and make the
+    # bordered system singular; only those go through the decomposition
+    sign, _ = np.linalg.slogdet(coef_matrices)
+    singular = sign == 0
+
+    prob = np.empty((batch_size, count))
+    prob[~singular] = np.linalg.solve(
+        coef_matrices[~singular], ordinate_values[~singular]
+    )[..., 0]
+    for idx in np.flatnonzero(singular):
+        prob[idx] = _calculate_probability(matrices[idx], "auto")
+    return prob
+
+
+def _calculate_time_block(
+    generators: NDArray[np.float64],
+    prob_target: NDArray[np.float64],
+    max_time: float,
+) -> NDArray[np.float64]:
+    batch_size, count, _ = generators.shape
+    points = TIME_GRID_POINTS
+
+    prob_curr = np.full((batch_size, count), 1.0 / count)
+    time = np.full((batch_size, count), np.inf)
+
+    time[np.abs(prob_curr - prob_target) <= EPS] = 0.0
+    settled = np.zeros((batch_size, count), dtype=bool)
+
+    max_rate = -np.diagonal(generators, axis1=1, axis2=2).min(axis=1)
+    window = np.full(batch_size, max_time, dtype=np.float64)
+    np.divide(1.0, max_rate, out=window, where=max_rate > 0)
+    time_curr = np.zeros(batch_size)
+
+    step = np.zeros(batch_size)
+    transition = np.empty_like(generators)
+
+    while (active := ~settled.all(axis=1) & (time_curr < max_time)).any():
+        chains = np.flatnonzero(active)
+        step_next = (
+            np.minimum(window[chains], max_time - time_curr[chains]) / points
+        )
+
+        # windows double, so the step matrix is usually the square of the
+        # previous one; expm is only needed at the start and at the horizon
+        squared = step_next == 2 * step[chains]
+        transition[chains[squared]] = np.matmul(
+            transition[chains[squared]], transition[chains[squared]]
+        )
+        fresh = chains[~squared]
+        transition[fresh] = scipy_linalg.expm(
+            generators[fresh] * step_next[~squared, np.newaxis, np.newaxis]
+        )
+        step[chains] = step_next
+
+        chain_transition = transition[chains]
+        trajectory = np.empty((points + 1, len(chains), count))
+        trajectory[0] = prob_curr[chains]
+        for k in range(points):
+            trajectory[k + 1] = np.einsum(
+                "cij,cj->ci", chain_transition, trajectory[k]
+            )
+
+        deviation = trajectory - prob_target[chains]
+        left, offset = _final_entries(deviation.reshape(points + 1, -1))
+        left = left.reshape(len(chains), count)
+        offset = offset.reshape(len(chains), count)
+
+        chain_idx, states = np.nonzero(left)
+        time[chains[chain_idx], states] = (
+            time_curr[chains[chain_idx]]
+            + offset[chain_idx, states] * step_next[chain_idx]
+        )
+        settled[chains] = ~left
+
+        prob_curr[chains] = trajectory[-1]
+        time_curr[chains] += step_next * points
+        window[chains] *= 2
+
+    return time
+
+
+def calculate_time_batch(
+    matrices: NDArray[np.float64],
+    probs: NDArray[np.float64],
+    max_time: float = MAX_TIME,
+) -> NDArray[np.float64]:
+    matrices = np.asarray(matrices, dtype=np.float64)
+    probs = np.asarray(probs, dtype=np.float64)
+    batch_size, count, _ = matrices.shape
 
-        for i in range(count):
-            if not time[i] and abs(prob_curr[i] - prob[i]) <= EPS:
-                time[i] = time_curr
+    block_size = max(TRAJECTORY_SIZE // (count * (TIME_GRID_POINTS + 1)), 1)
+    time = np.empty((batch_size, count))
 
-            prob_curr[i] += prob_delta[i]
-        time_curr += TIME_DELTA
+    for start in range(0, batch_size, block_size):
+        block = slice(start, start + block_size)
+        time[block] = _calculate_time_block(
+            _create_coef_batch(matrices[block]), probs[block], max_time
+        )
 
     return time
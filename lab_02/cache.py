@@ -0,0 +1,97 @@
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+CACHE_SIZE = 256
+
+
+def matrix_key(matrix: Any, *settings: Any) -> str:
+    digest = hashlib.sha256()
+
+    # the diagonal of an intensity matrix is ignored by the solvers, so
+    # matrices differing only there share a key
+    if sparse.issparse(matrix):
+        canonical = sparse.csr_matrix(matrix, dtype=np.float64, copy=True)
+        canonical.setdiag(0.0)
+        canonical.eliminate_zeros()
+        canonical.sum_duplicates()
+        canonical.sort_indices()
+
+        digest.update(b"sparse")
+        digest.update(np.asarray(canonical.shape, dtype=np.int64).tobytes())
+        digest.update(canonical.indptr.astype(np.int64).tobytes())
+        digest.update(canonical.indices.astype(np.int64).tobytes())
+        digest.update(canonical.data.tobytes())
+    else:
+        canonical = np.array(matrix, dtype=np.float64)
+        np.fill_diagonal(canonical, 0.0)
+
+        digest.update(b"dense")
+        digest.update(np.asarray(canonical.shape, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(canonical).tobytes())
+
+    digest.update(repr(settings).encode())
+    return digest.hexdigest()
+
+
+class ResultsCache:
+    def __init__(
+        self, maxsize: int = CACHE_SIZE, path: str | Path | None = None
+    ) -> None:
+        self._maxsize = maxsize
+        self._path = Path(path) if path is not None else None
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = Lock()
+
+        if self._path is not None and self._path.exists():
+            with open(self._path, "rb") as file:
+                self._entries.update(pickle.load(file))
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+            if self._path is not None:
+                self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._path is not None:
+                self._save()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp_path, "wb") as file:
+            pickle.dump(dict(self._entries), file)
+        os.replace(tmp_path, self._path)
+
+
+results_cache = ResultsCache()
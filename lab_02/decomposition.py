@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.sparse import linalg as sparse_linalg
+
+
+@dataclass(slots=True, frozen=True)
+class ChainStructure:
+    labels: NDArray[np.int32]
+    closed: list[NDArray[np.intp]]
+    transient: NDArray[np.intp]
+
+    @property
+    def irreducible(self) -> bool:
+        return len(self.closed) == 1 and len(self.transient) == 0
+
+
+def _rates(matrix) -> sparse.csr_matrix:
+    rates = sparse.csr_matrix(matrix, dtype=np.float64, copy=True)
+    rates.setdiag(0.0)
+    rates.eliminate_zeros()
+    return rates
+
+
+def decompose(matrix) -> ChainStructure:
+    rates = _rates(matrix)
+    count, labels = csgraph.connected_components(
+        rates, directed=True, connection="strong"
+    )
+
+    # a class is closed when no transition leaves it
+    rows, cols = rates.nonzero()
+    leaving = labels[rows] != labels[cols]
+    is_open = np.zeros(count, dtype=bool)
+    is_open[labels[rows[leaving]]] = True
+
+    order = np.argsort(labels, kind="stable")
+    bounds = np.searchsorted(labels[order], np.arange(1, count))
+    classes = np.split(order, bounds)
+
+    closed = [classes[k] for k in np.flatnonzero(~is_open)]
+    transient = np.flatnonzero(is_open[labels])
+    return ChainStructure(labels, closed, transient)
+
+
+def absorption_probabilities(
+    matrix, structure: ChainStructure
+) -> NDArray[np.float64]:
+    transient = structure.transient
+    if not len(transient):
+        return np.zeros((0, len(structure.closed)))
+
+    rates = _rates(matrix)
+    out_rates = np.asarray(rates.sum(axis=1)).ravel()
+
+    # h[t, k] = P(absorbed in class k | start in t) solves
+    # (diag(out) - R_TT) h = R_TC 1_C
+    target = np.full(rates.shape[0], -1)
+    for k, states in enumerate(structure.closed):
+        target[states] = k
+    indicator = sparse.csr_matrix(
+        (
+            np.ones(len(target) - len(transient)),
+            (np.flatnonzero(target >= 0), target[target >= 0]),
+        ),
+        shape=(len(target), len(structure.closed)),
+    )
+
+    rates_transient = rates[transient]
+    system = sparse.diags(out_rates[transient]) - rates_transient[:, transient]
+    rhs = (rates_transient @ indicator).toarray()
+
+    return sparse_linalg.splu(system.tocsc()).solve(rhs)
@@ -0,0 +1,237 @@
+from collections.abc import Sequence
+from tkinter import *
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse
+
+GridData = NDArray[np.float64] | sparse.spmatrix
+
+
+class MatrixGrid(Frame):
+    def __init__(
+        self,
+        master: Misc,
+        visible_rows: int,
+        visible_columns: int,
+        row_names: Sequence[str] | None = None,
+        column_format: str = "{}:",
+        value_format: str = "{:g}",
+        readonly: bool = False,
+    ) -> None:
+        super().__init__(master)
+
+        self._visible_rows = visible_rows
+        self._visible_columns = visible_columns
+        self._row_names = row_names
+        self._column_format = column_format
+        self._value_format = value_format
+        self._readonly = readonly
+
+        self._data: GridData = np.zeros((0, 0))
+        # edits are kept apart from the backing matrix so sparse input is
+        # never densified and only touched cells are written back
+        self._edits: dict[tuple[int, int], float] = {}
+        self._top = 0
+        self._left = 0
+
+        self._row_labels: list[Label] = []
+        self._column_labels: list[Label] = []
+        self._cells: list[list[Entry]] = []
+        self._create_widgets()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._data.shape
+
+    def set_data(self, data: GridData) -> None:
+        self._data = data
+        self._edits.clear()
+        self._top = 0
+        self._left = 0
+        self._redraw()
+
+    def get_data(self) -> GridData:
+        self._store_visible()
+        if not self._edits:
+            return self._data
+
+        if sparse.issparse(self._data):
+            data = sparse.lil_matrix(self._data, dtype=np.float64)
+        else:
+            data = np.array(self._data, dtype=np.float64)
+        for (i, j), value in self._edits.items():
+            data[i, j] = value
+
+        return data.tocsr() if sparse.issparse(data) else data
+
+    def _create_widgets(self) -> None:
+        for i in range(self._visible_rows):
+            label = Label(self)
+            label.grid(column=0, row=i + 1)
+            self._row_labels.append(label)
+
+        for j in range(self._visible_columns):
+            label = Label(self)
+            label.grid(column=j + 1, row=0)
+            self._column_labels.append(label)
+
+        for i in range(self._visible_rows):
+            row: list[Entry] = []
+            for j in range(self._visible_columns):
+                cell = Entry(
+                    self,
+                    width=5,
+                    fg="green",
+                    font=("Arial", 16),
+                )
+                cell.grid(column=j + 1, row=i + 1)
+                if self._readonly:
+                    cell.config(state="readonly")
+                else:
+                    store = lambda i, j: lambda _: self._store_cell(i, j)
+                    cell.bind("<FocusOut>", store(i, j))
+                    cell.bind("<Return>", store(i, j))
+                row.append(cell)
+
+            self._cells.append(row)
+
+        self._vscroll = Scrollbar(self, orient=VERTICAL, command=self._yview)
+        self._vscroll.grid(
+            column=self._visible_columns + 1,
+            row=1,
+            rowspan=self._visible_rows,
+            sticky="ns",
+        )
+        self._hscroll = Scrollbar(self, orient=HORIZONTAL, command=self._xview)
+        self._hscroll.grid(
+            column=1,
+            row=self._visible_rows + 1,
+            columnspan=self._visible_columns,
+            sticky="ew",
+        )
+
+        for widget in (self, *self._row_labels, *sum(self._cells, [])):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Shift-MouseWheel>", self._on_shift_wheel)
+            widget.bind("<Button-4>", lambda _: self._scroll(-1, 0))
+            widget.bind("<Button-5>", lambda _: self._scroll(1, 0))
+            widget.bind("<Shift-Button-4>", lambda _: self._scroll(0, -1))
+            widget.bind("<Shift-Button-5>", lambda _: self._scroll(0, 1))
+
+    def _value(self, i: int, j: int) -> float:
+        if (i, j) in self._edits:
+            return self._edits[i, j]
+        return float(self._data[i, j])
+
+    def _store_cell(self, i: int, j: int) -> None:
+        row, column = self._top + i, self._left + j
+        if row >= self.shape[0] or column >= self.shape[1]:
+            return
+
+        cell = self._cells[i][j]
+        try:
+            value = float(cell.get())
+        except ValueError:
+            value = self._value(row, column)
+
+        if value != self._value(row, column):
+            self._edits[row, column] = value
+
+        cell.delete(0, END)
+        cell.insert(END, self._value_format.format(value))
+
+    def _store_visible(self) -> None:
+        if self._readonly:
+            return
+
+        for i in range(self._visible_rows):
+            for j in range(self._visible_columns):
+                self._store_cell(i, j)
+
+    def _redraw(self) -> None:
+        rows, columns = self.shape
+
+        for i, label in enumerate(self._row_labels):
+            row = self._top + i
+            if row < rows:
+                name = self._row_names[row] if self._row_names else row + 1
+                label.config(text=str(name))
+            else:
+                label.config(text="")
+
+        for j, label in enumerate(self._column_labels):
+            column = self._left + j
+            text = self._column_format.format(column + 1)
+            label.config(text=text if column < columns else "")
+
+        for i, row in enumerate(self._cells):
+            for j, cell in enumerate(row):
+                inside = self._top + i < rows and self._left + j < columns
+
+                cell.config(state="normal")
+                cell.delete(0, END)
+                if inside:
+                    value = self._value(self._top + i, self._left + j)
+                    if not np.isnan(value):
+                        cell.insert(END, self._value_format.format(value))
+
+                if not inside:
+                    cell.config(state="disabled")
+                elif self._readonly:
+                    cell.config(state="readonly")
+
+        self._vscroll.set(*self._fractions(self._top, self._visible_rows, rows))
+        self._hscroll.set(
+            *self._fractions(self._left, self._visible_columns, columns)
+        )
+
+    @staticmethod
+    def _fractions(start: int, visible: int, total: int) -> tuple[float, float]:
+        if total <= visible:
+            return 0.0, 1.0
+        return start / total, (start + visible) / total
+
+    def _scroll_to(self, top: int, left: int) -> None:
+        rows, columns = self.shape
+        top = max(0, min(top, rows - self._visible_rows))
+        left = max(0, min(left, columns - self._visible_columns))
+        if (top, left) == (self._top, self._left):
+            return
+
+        self._store_visible()
+        self._top, self._left = top, left
+        self._redraw()
+
+    def _scroll(self, rows: int, columns: int) -> None:
+        self._scroll_to(self._top + rows, self._left + columns)
+
+    def _view_position(
+        self, position: int, visible: int, total: int, *args: str
+    ) -> int:
+        match args:
+            case ("moveto", fraction):
+                return round(float(fraction) * total)
+            case ("scroll", count, "pages"):
+                return position + int(count) * visible
+            case ("scroll", count, _):
+                return position + int(count)
+        return position
+
+    def _yview(self, *args: str) -> None:
+        top = self._view_position(
+            self._top, self._visible_rows, self.shape[0], *args
+        )
+        self._scroll_to(top, self._left)
+
+    def _xview(self, *args: str) -> None:
+        left = self._view_position(
+            self._left, self._visible_columns, self.shape[1], *args
+        )
+        self._scroll_to(self._top, left)
+
+    def _on_wheel(self, event: Event) -> None:
+        self._scroll(-1 if event.delta > 0 else 1, 0)
+
+    def _on_shift_wheel(self, event: Event) -> None:
+        self._scroll(0, -1 if event.delta > 0 else 1)
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import io as scipy_io
+from scipy import sparse
+
+MATRIX_FILE_TYPES = (
+    ("Все матрицы", "*.csv *.txt *.npz *.npy *.mtx *.mm"),
+    ("CSV", "*.csv *.txt"),
+    ("NumPy", "*.npz *.npy"),
+    ("Matrix Market", "*.mtx *.mm"),
+)
+
+
+def _load_text(path: Path) -> NDArray[np.float64]:
+    with open(path) as file:
+        sample = file.readline()
+    delimiter = "," if "," in sample else (";" if ";" in sample else None)
+
+    return np.loadtxt(path, delimiter=delimiter, ndmin=2)
+
+
+def _load_npz(path: Path) -> NDArray[np.float64] | sparse.csr_matrix:
+    with np.load(path) as archive:
+        # files written by scipy.sparse.save_npz carry their format
+        if "format" in archive.files:
+            return sparse.load_npz(path).tocsr()
+
+        if "matrix" in archive.files:
+            return archive["matrix"]
+        if len(archive.files) == 1:
+            return archive[archive.files[0]]
+
+        raise ValueError(
+            f"{path.name}: expected a single array or a 'matrix' entry, "
+            f"got {archive.files}"
+        )
+
+
+def load_matrix(path: str | Path) -> NDArray[np.float64] | sparse.csr_matrix:
+    path = Path(path)
+
+    match path.suffix.lower():
+        case ".csv" | ".txt":
+            matrix = _load_text(path)
+        case ".npz":
+            matrix = _load_npz(path)
+        case ".npy":
+            matrix = np.load(path)
+        case ".mtx" | ".mm":
+            matrix = scipy_io.mmread(path)
+        case suffix:
+            raise ValueError(f"Unsupported matrix file type: {suffix!r}")
+
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+    else:
+        matrix = np.asarray(matrix, dtype=np.float64)
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(
+            f"{path.name}: intensity matrix must be square, "
+            f"got shape {matrix.shape}"
+        )
+
+    return matrix
@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse, stats
+
+TRAJECTORY_COUNT = 100_000
+BATCH_COUNT = 20
+CONFIDENCE = 0.95
+# upper bound on trajectories x states held in memory at once
+BLOCK_SIZE = 1 << 24
+
+
+@dataclass(slots=True, frozen=True)
+class SimulationResult:
+    occupancy: NDArray[np.float64]
+    occupancy_ci: NDArray[np.float64]
+    hitting_time: NDArray[np.float64]
+    hitting_time_ci: NDArray[np.float64]
+    hit_fraction: NDArray[np.float64]
+
+
+class _JumpTable:
+    def __init__(self, matrix) -> None:
+        rates = sparse.csr_matrix(matrix, dtype=np.float64, copy=True)
+        rates.setdiag(0.0)
+        rates.eliminate_zeros()
+        rates.sort_indices()
+
+        self.indptr = rates.indptr
+        self.indices = rates.indices
+        # one global running sum over all rows: the target of a jump from
+        # state s is found by a single searchsorted offset by the row start
+        self.cumsum = np.cumsum(rates.data)
+        self.row_start = np.concatenate(([0.0], self.cumsum))[rates.indptr[:-1]]
+        self.out_rates = np.asarray(rates.sum(axis=1)).ravel()
+
+    def jump(
+        self, states: NDArray[np.intp], rng: np.random.Generator
+    ) -> NDArray[np.intp]:
+        level = self.row_start[states] + rng.random(len(states)) * (
+            self.out_rates[states]
+        )
+        pos = np.searchsorted(self.cumsum, level, side="right")
+        # guard against rounding past the end of the row
+        pos = np.clip(pos, self.indptr[states], self.indptr[states + 1] - 1)
+        return self.indices[pos]
+
+
+def _accumulate(
+    target: NDArray[np.float64],
+    batch: NDArray[np.intp],
+    state: NDArray[np.intp],
+    weights: NDArray[np.float64] | None = None,
+) -> None:
+    batches, count = target.shape
+    target += np.bincount(
+        batch * count + state, weights=weights, minlength=batches * count
+    ).reshape(batches, count)
+
+
+def _confidence_interval(
+    batch_values: NDArray[np.float64], confidence: float
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    valid = np.sum(~np.isnan(batch_values), axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nanmean(batch_values, axis=0)
+        stderr = np.nanstd(batch_values, axis=0, ddof=1) / np.sqrt(valid)
+        quantile = stats.t.ppf(0.5 + confidence / 2, valid - 1)
+
+    return mean, np.where(valid > 1, quantile * stderr, np.inf)
+
+
+def simulate(
+    matrix,
+    max_time: float,
+    trajectories: int = TRAJECTORY_COUNT,
+    warmup: float = 0.0,
+    start: int | None = None,
+    batches: int = BATCH_COUNT,
+    confidence: float = CONFIDENCE,
+    rng: np.random.Generator | None = None,
+) -> SimulationResult:
+    rng = np.random.default_rng() if rng is None else rng
+    table = _JumpTable(matrix)
+    count = len(table.out_rates)
+
+    occupancy = np.zeros((batches, count))
+    hit_sum = np.zeros((batches, count))
+    hit_count = np.zeros((batches, count))
+    batch_size = np.bincount(
+        np.arange(trajectories) % batches, minlength=batches
+    )
+
+    block = max(1, BLOCK_SIZE // count)
+    for first in range(0, trajectories, block):
+        size = min(block, trajectories - first)
+        batch = (first + np.arange(size)) % batches
+
+        if start is None:
+            state = rng.integers(count, size=size)
+        else:
+            state = np.full(size, start)
+        time = np.zeros(size)
+        visited = np.zeros((size, count), dtype=bool)
+        visited[np.arange(size), state] = True
+        _accumulate(hit_count, batch, state)
+
+        alive = np.arange(size)
+        while len(alive):
+            with np.errstate(divide="ignore"):
+                hold = (
+                    rng.standard_exponential(len(alive))
+                    / table.out_rates[state]
+                )
+            end = np.minimum(time + hold, max_time)
+
+            dwell = end - np.maximum(time, warmup)
+            _accumulate(occupancy, batch, state, np.maximum(dwell, 0.0))
+
+            jumped = time + hold < max_time
+            alive, batch = alive[jumped], batch[jumped]
+            state = table.jump(state[jumped], rng)
+            time = end[jumped]
+
+            first_hit = ~visited[alive, state]
+            hit_batch, hit_state = batch[first_hit], state[first_hit]
+            visited[alive[first_hit], hit_state] = True
+            _accumulate(hit_sum, hit_batch, hit_state, time[first_hit])
+            _accumulate(hit_count, hit_batch, hit_state)
+
+    observed = max(max_time - warmup, 0.0) * batch_size[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        occupancy_mean, occupancy_ci = _confidence_interval(
+            occupancy / observed, confidence
+        )
+        _, hitting_ci = _confidence_interval(
+            np.where(hit_count > 0, hit_sum / hit_count, np.nan), confidence
+        )
+
+    hit_fraction = hit_count.sum(axis=0) / trajectories
+    hitting_time = hit_sum.sum(axis=0) / np.maximum(hit_count.sum(axis=0), 1)
+    hitting_time[hit_fraction == 0] = np.inf
+
+    return SimulationResult(
+        occupancy=occupancy_mean,
+        occupancy_ci=occupancy_ci,
+        hitting_time=hitting_time,
+        hitting_time_ci=hitting_ci,
+        hit_fraction=hit_fraction,
+    )
@@ -1,20 +1,46 @@
+import threading
+from queue import Empty, Queue
 from tkinter import *
-from algs import calculate_probability, calculate_time
+from tkinter import filedialog
+
+import numpy as np
+from scipy import sparse
+from algs import (
+    SPARSE_STATE_COUNT,
+    CalculationCancelled,
+    Matrix,
+    calculate_probability,
+    calculate_time,
+)
+from grid import MatrixGrid
+from matrix_io import MATRIX_FILE_TYPES, load_matrix
 
 
 class UI:
-    MAX_STATE_COUNT = 10
-    MTRX: list[list[Entry]] = []
-    RESULT: list[list[Entry]] = []
+    VISIBLE_STATE_COUNT = 10
+    DEFAULT_STATE_COUNT = 10
+    # even an empty sparse matrix keeps an index entry per row
+    MAX_STATE_COUNT = 10**6
+    POLL_INTERVAL = 100  # ms
 
     def __init__(self) -> None:
         self._window: Tk = self._create_window()
 
+        self._worker: threading.Thread | None = None
+        self._state_count = 0
+        self._cancel = threading.Event()
+        self._messages: Queue[tuple[str, object]] = Queue()
+        self._status = StringVar(master=self._window)
+        self._count = IntVar(
+            master=self._window, value=self.DEFAULT_STATE_COUNT
+        )
+
         self._add_labels()
         self._add_state_buttons()
 
         self._add_matrix(1, 1)
         self._add_result(1, 14)
+        self._update_state_count(self.DEFAULT_STATE_COUNT)
 
     def run(self) -> None:
         self._window.mainloop()
@@ -22,7 +48,7 @@ class UI:
     def _create_window(self) -> Tk:
         window = Tk()
         window.title("Цепи Маркова")
-        window.geometry("770x520")
+        window.geometry("860x640")
         window.resizable(False, False)
         return window
 
@@ -36,139 +62,179 @@ class UI:
         Label(self._window, text="Результат: ", padx=20).grid(column=0, row=14)
 
     def _add_state_buttons(self) -> None:
-        for idx in range(1, self.MAX_STATE_COUNT + 1):
-            cb = lambda n: lambda: self._update_state_count(n)
-            Button(self._window, text=str("X"), command=cb(idx)).grid(
-                column=idx + 1,
-                row=0,
-            )
+        count = Spinbox(
+            self._window,
+            from_=1,
+            to=self.MAX_STATE_COUNT,
+            width=8,
+            textvariable=self._count,
+            command=self._on_count_changed,
+        )
+        count.bind("<Return>", lambda _: self._on_count_changed())
+        count.grid(column=1, row=0, columnspan=3)
 
         Button(
+            self._window,
+            text="Открыть...",
+            command=self._open_matrix,
+        ).grid(column=4, row=0, columnspan=3)
+
+        self._start_button = Button(
             self._window,
             text="Пуск",
             command=self._calculate,
-        ).grid(column=1, row=13, columnspan=12, pady=20)
+        )
+        self._start_button.grid(column=1, row=13, columnspan=6, pady=20)
+
+        self._cancel_button = Button(
+            self._window,
+            text="Отмена",
+            command=self._cancel.set,
+            state="disabled",
+        )
+        self._cancel_button.grid(column=7, row=13, columnspan=6, pady=20)
+
+        Label(self._window, textvariable=self._status).grid(
+            column=1, row=17, columnspan=12
+        )
 
     def _add_matrix(self, start_column: int, start_row: int) -> None:
-        for i in range(self.MAX_STATE_COUNT):
-            row: list[Entry] = []
-            for j in range(self.MAX_STATE_COUNT):
-                Label(self._window, text=f"{i + 1}").grid(
-                    column=start_column,
-                    row=start_row + i + 1,
-                )
-                Label(self._window, text=f"{j + 1}:",).grid(
-                    column=start_column + j + 1,
-                    row=start_row,
-                )
-
-                cell = Entry(
-                    self._window,
-                    width=5,
-                    fg="green",
-                    font=("Arial", 16),
-                )
-                cell.grid(
-                    column=start_column + j + 1,
-                    row=start_row + i + 1,
-                )
-                cell.insert(END, "0")
-
-                row.append(cell)
-
-            self.MTRX.append(row)
+        self._matrix_grid = MatrixGrid(
+            self._window,
+            self.VISIBLE_STATE_COUNT,
+            self.VISIBLE_STATE_COUNT,
+        )
+        self._matrix_grid.grid(
+            column=start_column,
+            row=start_row,
+            columnspan=self.VISIBLE_STATE_COUNT + 2,
+            rowspan=12,
+        )
 
     def _add_result(self, start_column: int, start_row: int) -> None:
-        params = ("P", "t")
-
-        for i, param in enumerate(params, start=1):
-            row: list[Entry] = []
-            for j in range(1, self.MAX_STATE_COUNT + 1):
-                Label(master=self._window, text=param).grid(
-                    column=start_column,
-                    row=start_row + i,
-                )
-                Label(master=self._window, text="S" + str(j) + ":",).grid(
-                    column=start_column + j,
-                    row=start_row,
-                )
-
-                cell = Entry(
-                    master=self._window,
-                    width=5,
-                    fg="green",
-                    font=("Arial", 16),
-                )
-                cell.grid(column=start_column + j, row=start_row + i)
-
-                cell.config(
-                    # state="readonly",
-                    readonlybackground="green",
-                )
-                row.append(cell)
-
-            self.RESULT.append(row)
-
-    def _update_matrix(self, count: int) -> None:
-        if count > self.MAX_STATE_COUNT:
-            return
-
-        for i in range(self.MAX_STATE_COUNT):
-            for j in range(self.MAX_STATE_COUNT):
-                if i > count - 1 or j > count - 1:
-                    self.MTRX[i][j].delete(0, "end")
-                    self.MTRX[i][j].config(state="disabled")
-                else:
-                    self.MTRX[i][j].config(state="normal")
-                    self.MTRX[i][j].delete(0, "end")
-                    self.MTRX[i][j].insert(END, "0")
-
-    def _update_result(self, count: int) -> None:
-        if count > self.MAX_STATE_COUNT:
+        self._result_grid = MatrixGrid(
+            self._window,
+            2,
+            self.VISIBLE_STATE_COUNT,
+            row_names=("P", "t"),
+            column_format="S{}:",
+            value_format="{:.2f}",
+            readonly=True,
+        )
+        self._result_grid.grid(
+            column=start_column,
+            row=start_row,
+            columnspan=self.VISIBLE_STATE_COUNT + 2,
+            rowspan=3,
+        )
+
+    def _on_count_changed(self) -> None:
+        try:
+            count = self._count.get()
+        except TclError:
             return
 
-        for i in range(len(self.RESULT)):
-            for j in range(self.MAX_STATE_COUNT):
-                if j > count - 1:
-                    self.RESULT[i][j].config(state="normal")
-                    self.RESULT[i][j].delete(0, "end")
-                    self.RESULT[i][j].config(state="disabled")
-                else:
-                    self.RESULT[i][j].config(state="normal")
-                    self.RESULT[i][j].delete(0, "end")
-                    # self.RESULT[i][j].config(state="readonly")
+        self._update_state_count(count)
 
     def _update_state_count(self, count: int) -> None:
-        self._update_matrix(count)
-        self._update_result(count)
+        if count < 1:
+            return
 
-    def _get_intensity_matrix(self) -> list[list[float]]:
-        matrix: list[list[float]] = []
-        for i in range(self.MAX_STATE_COUNT):
-            row: list[float] = []
+        count = min(count, self.MAX_STATE_COUNT)
+        self._count.set(count)
+        if count >= SPARSE_STATE_COUNT:
+            self._matrix_grid.set_data(sparse.csr_matrix((count, count)))
+        else:
+            self._matrix_grid.set_data(np.zeros((count, count)))
+        self._clear_result()
+
+    def _clear_result(self) -> None:
+        # the result grid stays empty until there is something to show
+        self._result_grid.set_data(np.empty((2, 0)))
+
+    def _open_matrix(self) -> None:
+        path = filedialog.askopenfilename(
+            parent=self._window, filetypes=MATRIX_FILE_TYPES
+        )
+        if not path:
+            return
 
-            for j in range(self.MAX_STATE_COUNT):
-                if self.MTRX[i][j]["state"] == "normal":
-                    row.append(float(self.MTRX[i][j].get()))
+        try:
+            matrix = load_matrix(path)
+        except (OSError, ValueError) as e:
+            self._status.set(f"Ошибка: {e}")
+            return
 
-            if row:
-                matrix.append(row)
+        count = matrix.shape[0]
+        self._count.set(count)
+        self._matrix_grid.set_data(matrix)
+        self._clear_result()
+        self._status.set(f"Загружено состояний: {count}")
 
-        return matrix
+    def _get_intensity_matrix(self) -> Matrix:
+        return self._matrix_grid.get_data()
 
     def _calculate(self) -> None:
-        matrix = self._get_intensity_matrix()
-
-        prob_res = calculate_probability(matrix)
-        time_res = calculate_time(matrix, prob_res)
+        if self._worker is not None and self._worker.is_alive():
+            return
 
-        result = [prob_res, time_res]
+        matrix = self._get_intensity_matrix()
+        self._state_count = matrix.shape[0]
+
+        self._cancel.clear()
+        self._start_button.config(state="disabled")
+        self._cancel_button.config(state="normal")
+        self._status.set("Расчёт...")
+
+        self._worker = threading.Thread(
+            target=self._run_calculation, args=(matrix,), daemon=True
+        )
+        self._worker.start()
+        self._window.after(self.POLL_INTERVAL, self._poll_calculation)
+
+    def _run_calculation(self, matrix: Matrix) -> None:
+        try:
+            prob_res = calculate_probability(matrix)
+            time_res = calculate_time(
+                matrix,
+                prob_res,
+                progress=lambda t, n: self._messages.put(("progress", (t, n))),
+                cancel=self._cancel,
+            )
+        except CalculationCancelled:
+            self._messages.put(("cancelled", None))
+        except Exception as e:
+            self._messages.put(("error", e))
+        else:
+            self._messages.put(("done", [prob_res, time_res]))
+
+    def _poll_calculation(self) -> None:
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except Empty:
+                self._window.after(self.POLL_INTERVAL, self._poll_calculation)
+                return
+
+            match kind:
+                case "progress":
+                    time_curr, settled = payload
+                    self._status.set(
+                        f"t = {time_curr:.2f}, "
+                        f"установилось состояний: {settled}/{self._state_count}"
+                    )
+                    continue
+                case "done":
+                    self._show_result(payload)
+                    self._status.set("")
+                case "cancelled":
+                    self._status.set("Расчёт отменён")
+                case "error":
+                    self._status.set(f"Ошибка: {payload}")
+
+            self._start_button.config(state="normal")
+            self._cancel_button.config(state="disabled")
+            return
 
-        for i in range(len(result)):
-            for j in range(len(result[0])):
-                self.RESULT[i][j].config(state="normal")
-                self.RESULT[i][j].delete(0, "end")
-                self.RESULT[i][j].insert(
-                    END, "{:.2f}".format(round(result[i][j], 2))
-                )
-                # self.RESULT[i][j].config(state="readonly")
+    def _show_result(self, result: list[list[float]]) -> None:
+        self._result_grid.set_data(np.array(result))
@@ -1,17 +1,65 @@
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
 from random import randint
 
+import numpy as np
+from numpy.typing import NDArray
 
-def generate_tabular(count, low=0, high=100):
-    seq = []
-    with open("table.txt") as file:
+from approval import RandomnessFactor, lag_unique_counts
+from lcg import DEFAULT_PARAMETERS, LinearCongruentialGenerator
+
+TABLE_PATH = Path(__file__).with_name("table.txt")
+DIGIT_RANGES = ((0, 10), (10, 100), (100, 1000))
+
+# m, a, c, x0
+LcgParameters = tuple[int, int, int, int]
+
+
+def _parse_table(path: Path) -> NDArray[np.uint32]:
+    values: list[str] = []
+    with open(path) as file:
         for line in file:
-            for curr in line.split(" ")[1:]:
-                if len(seq) < count and curr != "":
-                    seq.append(low + int(curr) % (high - low))
-            if len(seq) >= count:
-                break
-    return seq
+            # the first column is the line number
+            values.extend(line.split()[1:])
+    return np.array(values, dtype=np.uint32)
+
+
+def compile_table(path: Path = TABLE_PATH) -> Path:
+    binary_path = path.with_suffix(".npy")
+    np.save(binary_path, _parse_table(path))
+    return binary_path
+
+
+@cache
+def load_table(path: Path = TABLE_PATH) -> NDArray[np.uint32]:
+    binary_path = path.with_suffix(".npy")
+    if (
+        not binary_path.exists()
+        or binary_path.stat().st_mtime < path.stat().st_mtime
+    ):
+        try:
+            compile_table(path)
+        except OSError:
+            # a read-only checkout still works from the parsed text
+            return _parse_table(path)
+
+    return np.load(binary_path, mmap_mode="r")
+
+
+def generate_tabular(
+    count: int, low: int = 0, high: int = 100, offset: int = 0
+) -> NDArray[np.int64]:
+    values = load_table()[offset : offset + count].astype(np.int64)
+    return low + values % (high - low)
+
+
+def generate_tabular_ranges(
+    count: int, ranges: Sequence[tuple[int, int]], offset: int = 0
+) -> list[NDArray[np.int64]]:
+    values = load_table()[offset : offset + count].astype(np.int64)
+    return [low + values % (high - low) for low, high in ranges]
 
 
 def __setup_linear_congruent():
@@ -19,30 +67,58 @@ def __setup_linear_congruent():
     a = randint(10000, 100000)
     c = randint(10000, 100000)
     x0 = randint(10000, 100000)
-    return 312500, 36261, 66037, 60000
+    return DEFAULT_PARAMETERS
 
 
 def generate_linear_congruent(
-    count: int, low: int = 0, high: int = 100
-) -> Sequence[int]:
-    m, a, c, x0 = __setup_linear_congruent()
-
-    seq: list[int] = [x0]
-    for i in range(1, count + 1):
-        curr = (seq[i - 1] * a + c) % m
-        seq.append(low + curr % (high - low))
+    count: int,
+    low: int = 0,
+    high: int = 100,
+    parameters: LcgParameters | None = None,
+) -> NDArray[np.int64]:
+    generator = LinearCongruentialGenerator(
+        *(parameters or __setup_linear_congruent())
+    )
+    return generator.generate(count, low, high)
 
-    return seq[1:]
 
+def generate_linear_congruent_ranges(
+    count: int,
+    ranges: Sequence[tuple[int, int]],
+    parameters: LcgParameters | None = None,
+) -> list[NDArray[np.int64]]:
+    generator = LinearCongruentialGenerator(
+        *(parameters or __setup_linear_congruent())
+    )
+    return generator.generate_ranges(count, ranges)
 
-def __slice(seq: Sequence[int], step: int) -> Sequence[int]:
-    return [abs(seq[i] - seq[i + step]) for i in range(0, len(seq) - step, 1)]
 
+def approve_sequence(
+    seq: Sequence[int],
+    lag_count: int | None = None,
+    rng: np.random.Generator | None = None,
+) -> float:
+    lags = np.arange(1, len(seq) - 1)
+    if lag_count is not None and lag_count < len(lags):
+        rng = np.random.default_rng() if rng is None else rng
+        lags = np.sort(rng.choice(lags, size=lag_count, replace=False))
 
-def __unique_qty(seq: Sequence[int]) -> float:
-    return (len(set(seq)) - 1) / len(seq)
+    unique = lag_unique_counts(np.asarray(seq), lags)
+    # same (unique - 1) / len(slice) per lag and left-to-right float sum as
+    # the former set-based loop, so full runs give identical results
+    res = ((unique - 1) / (len(seq) - lags)).tolist()
+    return sum(res) / len(res)
 
 
-def approve_sequence(seq: Sequence[int]) -> float:
-    res = [__unique_qty(__slice(seq, step)) for step in range(1, len(seq) - 1)]
-    return sum(res) / len(res)
+def approve_sequences(
+    seqs: Sequence[Sequence[int]],
+    lag_count: int | None = None,
+    seed: int | None = None,
+) -> list[float]:
+    # one generator per sequence: Generator objects are not thread-safe
+    rngs = [np.random.default_rng(seed) for _ in seqs]
+    # the FFT and ufunc kernels release the GIL, so threads overlap
+    with ThreadPoolExecutor(max_workers=len(seqs) or 1) as pool:
+        return list(
+            pool.map(approve_sequence, seqs, [lag_count] * len(seqs), rngs)
+        )
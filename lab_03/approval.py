@@ -0,0 +1,214 @@
+import os
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft
+
+# cells of the (value x position) indicator image the FFT path may allocate
+FFT_SIZE = 1 << 24
+# lags x sequence length below which a process pool is not worth starting
+PARALLEL_WORK = 1 << 28
+LAG_CHUNK = 256
+# widest value range, relative to the sequence length, counted by bincount
+BINCOUNT_SPAN_FACTOR = 4
+
+_shared: tuple[shared_memory.SharedMemory, NDArray[np.int64]] | None = None
+
+
+def _unique_counts_fft(
+    values: NDArray[np.int64], lags: NDArray[np.intp], span: int
+) -> NDArray[np.int64]:
+    count = len(values)
+    shape = (fft.next_fast_len(2 * span), fft.next_fast_len(2 * count))
+
+    # autocorrelating the indicator image X[v, i] = [x_i == v] gives, at
+    # [d, k], the number of pairs with x_{i+k} - x_i == d
+    image = np.zeros(shape)
+    image[values, np.arange(count)] = 1.0
+    spectrum = fft.rfft2(image, workers=-1)
+    spectrum *= spectrum.conj()
+    pairs = fft.irfft2(spectrum, s=shape, workers=-1)[:, lags] > 0.5
+
+    present = pairs[:span].copy()
+    # negative differences wrap around to the end of the first axis
+    present[1:] |= pairs[shape[0] - 1 : shape[0] - span : -1]
+    return present.sum(axis=0)
+
+
+def _unique_counts_direct(
+    values: NDArray[np.int64], lags: NDArray[np.intp], span: int
+) -> NDArray[np.int64]:
+    # a bincount table only pays off while the range is O(n); wider
+    # ranges sort each lag's differences instead
+    by_sort = span > BINCOUNT_SPAN_FACTOR * len(values)
+
+    counts = np.empty(len(lags), dtype=np.int64)
+    for idx, lag in enumerate(lags):
+        diff = np.abs(values[lag:] - values[:-lag])
+        if by_sort:
+            diff.sort()
+            counts[idx] = np.count_nonzero(np.diff(diff)) + 1
+        else:
+            counts[idx] = np.count_nonzero(np.bincount(diff, minlength=span))
+    return counts
+
+
+def _attach(name: str, count: int) -> None:
+    global _shared
+    memory = shared_memory.SharedMemory(name=name)
+    _shared = memory, np.ndarray(count, dtype=np.int64, buffer=memory.buf)
+
+
+def _unique_counts_shared(
+    lags: NDArray[np.intp], span: int
+) -> NDArray[np.int64]:
+    return _unique_counts_direct(_shared[1], lags, span)
+
+
+def _unique_counts_parallel(
+    values: NDArray[np.int64],
+    lags: NDArray[np.intp],
+    span: int,
+    workers: int,
+) -> NDArray[np.int64]:
+    memory = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    try:
+        np.ndarray(len(values), dtype=np.int64, buffer=memory.buf)[:] = values
+
+        chunks = np.array_split(lags, max(1, len(lags) // LAG_CHUNK))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(memory.name, len(values)),
+        ) as pool:
+            counts = list(
+                pool.map(_unique_counts_shared, chunks, [span] * len(chunks))
+            )
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return np.concatenate(counts)
+
+
+def lag_unique_counts(
+    values: NDArray[np.int64],
+    lags: NDArray[np.intp],
+    workers: int | None = None,
+) -> NDArray[np.int64]:
+    values = np.asarray(values, dtype=np.int64)
+    lags = np.asarray(lags, dtype=np.intp)
+    if not len(lags):
+        return np.empty(0, dtype=np.int64)
+
+    values = values - values.min()
+    span = int(values.max()) + 1
+    count = len(values)
+
+    if 4 * span * count <= FFT_SIZE:
+        return _unique_counts_fft(values, lags, span)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(lags) * count >= PARALLEL_WORK:
+        return _unique_counts_parallel(values, lags, span, workers)
+
+    return _unique_counts_direct(values, lags, span)
+
+
+class RandomnessFactor:
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._values: list[int] = []
+        # _diffs[k - 1] counts |x_{i+k} - x_i| over every pair at lag k
+        self._diffs: list[Counter[int]] = []
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> list[int]:
+        return list(self._values)
+
+    def append(self, value: int) -> None:
+        value = int(value)
+        if self._values:
+            self._diffs.append(Counter())
+        for lag, prev in enumerate(reversed(self._values), 1):
+            self._diffs[lag - 1][abs(value - prev)] += 1
+        self._values.append(value)
+
+    def extend(self, values: Iterable[int]) -> None:
+        start = len(self._values)
+        self._values.extend(int(value) for value in values)
+        count = len(self._values)
+        if count == start:
+            return
+
+        # bulk loads count the new pairs lag by lag in NumPy
+        seq = np.asarray(self._values, dtype=np.int64)
+        self._diffs.extend(
+            Counter() for _ in range(count - 1 - len(self._diffs))
+        )
+        for lag in range(1, count):
+            first = max(lag, start)
+            diffs = np.abs(seq[first:] - seq[first - lag : count - lag])
+            keys, counts = np.unique(diffs, return_counts=True)
+            self._diffs[lag - 1].update(
+                dict(zip(keys.tolist(), counts.tolist()))
+            )
+
+    def pop(self) -> int:
+        value = self._values.pop()
+        for lag, prev in enumerate(reversed(self._values), 1):
+            self._discard(lag, abs(value - prev))
+        if self._values:
+            self._diffs.pop()
+        return value
+
+    def __setitem__(self, index: int, value: int) -> None:
+        index = range(len(self._values))[index]
+        old, value = self._values[index], int(value)
+        if old == value:
+            return
+
+        for other_index, other in enumerate(self._values):
+            lag = abs(index - other_index)
+            if lag:
+                self._discard(lag, abs(old - other))
+                self._diffs[lag - 1][abs(value - other)] += 1
+        self._values[index] = value
+
+    def assign(self, values: Iterable[int]) -> None:
+        # only the positions that differ from the current sequence are
+        # touched, so a small edit costs O(n) per changed value
+        values = [int(value) for value in values]
+        while len(self._values) > len(values):
+            self.pop()
+        for index, value in enumerate(values[: len(self._values)]):
+            if self._values[index] != value:
+                self[index] = value
+        self.extend(values[len(self._values) :])
+
+    def _discard(self, lag: int, diff: int) -> None:
+        counter = self._diffs[lag - 1]
+        counter[diff] -= 1
+        if not counter[diff]:
+            del counter[diff]
+
+    def factor(self) -> float:
+        count = len(self._values)
+        if count < 3:
+            raise ValueError("the factor needs at least 3 values")
+
+        # the last lag has a single pair and is left out, as in
+        # approve_sequence; the float sum runs in the same order
+        res = [
+            (len(self._diffs[lag - 1]) - 1) / (count - lag)
+            for lag in range(1, count - 1)
+        ]
+        return sum(res) / len(res)
@@ -0,0 +1,55 @@
+from time import perf_counter
+
+import click
+
+from generators import GENERATORS, make_generator
+from quality import Battery
+
+CHUNK_SIZE = 1 << 20
+
+
+def benchmark(
+    name: str, count: int, low: int, high: int, seed: int | None
+) -> tuple[float, dict[str, float]]:
+    generator = make_generator(name, seed)
+    battery = Battery(low, high)
+
+    elapsed = 0.0
+    for start in range(0, count, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, count - start)
+
+        begin = perf_counter()
+        chunk = generator.generate(size, low, high)
+        elapsed += perf_counter() - begin
+
+        battery.update(chunk)
+
+    return count / elapsed, battery.report()
+
+
+@click.command(help="Throughput and quality of every generator backend")
+@click.option("-count", type=int, default=10**7, help="Values per generator")
+@click.option("-low", type=int, default=0, help="Lower bound (inclusive)")
+@click.option("-high", type=int, default=10, help="Upper bound (exclusive)")
+@click.option("-seed", type=int, default=None, help="Seed for every backend")
+@click.option(
+    "-generator",
+    "names",
+    type=click.Choice(sorted(GENERATORS)),
+    multiple=True,
+    help="Backends to run (all by default)",
+)
+def main(
+    count: int, low: int, high: int, seed: int | None, names: tuple[str, ...]
+) -> None:
+    for name in names or GENERATORS:
+        throughput, report = benchmark(name, count, low, high, seed)
+
+        click.secho(f"{name}: {throughput / 1e6:.1f}M values/s", bold=True)
+        for test, p_value in report.items():
+            color = "red" if p_value < 0.01 else None
+            click.secho(f"  {test:<16} p = {p_value:.4f}", fg=color)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from lcg import DEFAULT_PARAMETERS, LinearCongruentialGenerator
+from prng import PseudoRandomGenerator
+
+XOSHIRO_LANES = 1 << 14
+MINSTD_MODULUS = (1 << 31) - 1
+MINSTD_MULTIPLIER = 48271
+
+GeneratorFactory = Callable[[int | None], PseudoRandomGenerator]
+GENERATORS: dict[str, GeneratorFactory] = {}
+
+
+def register(name: str) -> Callable[[GeneratorFactory], GeneratorFactory]:
+    def decorator(factory: GeneratorFactory) -> GeneratorFactory:
+        GENERATORS[name] = factory
+        return factory
+
+    return decorator
+
+
+def make_generator(name: str, seed: int | None = None) -> PseudoRandomGenerator:
+    try:
+        factory = GENERATORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown generator: {name!r}") from None
+
+    return factory(seed)
+
+
+class MultiplicativeCongruentialGenerator(LinearCongruentialGenerator):
+    name = "mcg"
+
+    def __init__(self, m: int, a: int, x0: int) -> None:
+        # the state never reaches zero, so seeds are mapped into [1, m)
+        super().__init__(m, a, 0, (x0 - 1) % (m - 1) + 1)
+
+    @property
+    def raw_range(self) -> int:
+        return self._m - 1
+
+    def random_raw(self, count: int) -> NDArray[np.int64]:
+        return super().random_raw(count) - 1
+
+
+class BitGeneratorBackend(PseudoRandomGenerator):
+    def __init__(
+        self, name: str, bit_generator: np.random.BitGenerator, bits: int
+    ) -> None:
+        self.name = name
+        self._bit_generator = bit_generator
+        self._bits = bits
+
+    @property
+    def raw_range(self) -> int:
+        return 1 << self._bits
+
+    def random_raw(self, count: int) -> NDArray[np.uint64]:
+        return self._bit_generator.random_raw(count)
+
+
+def _rotl(x: NDArray[np.uint64], k: int) -> NDArray[np.uint64]:
+    return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+
+
+class Xoshiro256StarStar(PseudoRandomGenerator):
+    name = "xoshiro256**"
+
+    def __init__(self, seed: int | None = None, lanes: int = XOSHIRO_LANES):
+        # independent lanes step together; each lane is a full xoshiro
+        # stream seeded through SeedSequence
+        state = np.random.SeedSequence(seed).generate_state(
+            4 * lanes, np.uint64
+        )
+        self._state = state.reshape(4, lanes)
+        self._buffer = np.empty(0, dtype=np.uint64)
+
+    @property
+    def raw_range(self) -> int:
+        return 1 << 64
+
+    def _step(self) -> NDArray[np.uint64]:
+        s0, s1, s2, s3 = self._state
+        result = _rotl(s1 * np.uint64(5), 7) * np.uint64(9)
+        t = s1 << np.uint64(17)
+
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3[:] = _rotl(s3, 45)
+        return result
+
+    def random_raw(self, count: int) -> NDArray[np.uint64]:
+        lanes = self._state.shape[1]
+        steps = max(0, -(-(count - len(self._buffer)) // lanes))
+
+        out = np.empty(len(self._buffer) + steps * lanes, dtype=np.uint64)
+        out[: len(self._buffer)] = self._buffer
+        for step in range(steps):
+            start = len(self._buffer) + step * lanes
+            out[start : start + lanes] = self._step()
+
+        self._buffer = out[count:]
+        return out[:count]
+
+
+@register("lcg")
+def _make_lcg(seed: int | None) -> PseudoRandomGenerator:
+    m, a, c, x0 = DEFAULT_PARAMETERS
+    return LinearCongruentialGenerator(m, a, c, x0 if seed is None else seed)
+
+
+@register("mcg")
+def _make_mcg(seed: int | None) -> PseudoRandomGenerator:
+    x0 = 1 if seed is None else seed
+    return MultiplicativeCongruentialGenerator(
+        MINSTD_MODULUS, MINSTD_MULTIPLIER, x0
+    )
+
+
+@register("xoshiro256**")
+def _make_xoshiro(seed: int | None) -> PseudoRandomGenerator:
+    return Xoshiro256StarStar(seed)
+
+
+@register("pcg64")
+def _make_pcg64(seed: int | None) -> PseudoRandomGenerator:
+    return BitGeneratorBackend("pcg64", np.random.PCG64(seed), 64)
+
+
+@register("mt19937")
+def _make_mt19937(seed: int | None) -> PseudoRandomGenerator:
+    return BitGeneratorBackend("mt19937", np.random.MT19937(seed), 32)
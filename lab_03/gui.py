@@ -0,0 +1,559 @@
+from tkinter import *
+from tkinter import filedialog
+import algs
+import numpy as np
+import streams
+
+DEFAULT_ROWS_COUNT = 25
+CELL_WIDTH = 5
+FONT = ("Arial", 15)
+# longer sequences are scored on a random sample of lags
+APPROVE_LAG_COUNT = 100
+# fixed so the same data always shows the same estimate
+APPROVE_SEED = 0
+# leading values of an opened file shown in the manual table
+OPEN_VALUE_COUNT = 10000
+
+manualFactor = algs.RandomnessFactor()
+
+
+class YScrollableTable:
+    def __init__(self, window, columns, rows):
+        self.__cellState = "normal"
+        self.__visibleRowsCnt = 15
+        self.__visibleColumnsCnt = len(columns)
+        self.__top = 0
+
+        # only the visible rows own widgets; the values live in arrays and
+        # are paged into the widget pool on scroll
+        self.__data = np.zeros((len(rows), len(columns)), dtype=np.int64)
+        self.__rowNames = np.asarray(rows)
+
+        self.__frameCanvas = LabelFrame(window)
+        self.__frameCanvas.grid(column=0, row=0, sticky="nw")
+
+        self.__frame = Frame(self.__frameCanvas)
+        self.__frame.grid(row=0, column=0, sticky="nw", padx=(5, 0), pady=5)
+
+        self.__scrollbar = Scrollbar(
+            self.__frameCanvas, orient="vertical", command=self.__yview
+        )
+        self.__scrollbar.grid(row=0, column=1, sticky="ns", padx=0, pady=5)
+
+        self.__createLabelCell(row=0, column=0)
+        self.__columns = [
+            self.__createLabelCell(row=0, column=j + 1, value=columnName)
+            for j, columnName in enumerate(columns)
+        ]
+        self.__rows = []
+        self.__table = []
+        for _ in range(self.__visibleRowsCnt):
+            self.__addVisibleRow()
+        self.__frame.update_idletasks()
+
+        self.__width = self.__frame.winfo_reqwidth()
+        self.__height = self.__frame.winfo_reqheight()
+        self.__frame.config(width=self.__width, height=self.__height)
+        self.__frame.grid_propagate(False)
+
+        self.__redraw()
+
+    def __addVisibleRow(self):
+        i = len(self.__rows)
+        self.__rows.append(self.__createLabelCell(row=i + 1, column=0))
+
+        row = []
+        for j in range(len(self.__columns)):
+            cell = self.__createTableCell(row=i + 1, column=j + 1)
+            store = lambda i, j: lambda _: self.__storeCell(i, j)
+            cell.bind("<FocusOut>", store(i, j))
+            cell.bind("<Return>", store(i, j))
+            row.append(cell)
+        self.__table.append(row)
+
+        for cell in [self.__rows[i], *row]:
+            cell.bind("<MouseWheel>", self.__onWheel)
+            cell.bind("<Button-4>", lambda _: self.__scrollTo(self.__top - 1))
+            cell.bind("<Button-5>", lambda _: self.__scrollTo(self.__top + 1))
+
+    def __removeVisibleRow(self):
+        self.__rows.pop().destroy()
+        for cell in self.__table.pop():
+            cell.destroy()
+
+    def __createTableCell(self, row, column, value=0):
+        cell = Entry(
+            self.__frame,
+            width=CELL_WIDTH,
+            font=FONT,
+            fg="blue",
+            highlightthickness=1,
+            relief=FLAT,
+        )
+        cell.insert(END, str(value))
+        cell.grid(column=column, row=row, sticky=NSEW)
+        cell.config(state=self.__cellState, readonlybackground="red")
+        return cell
+
+    def __createLabelCell(self, row, column, value=""):
+        cell = Entry(
+            self.__frame,
+            width=CELL_WIDTH,
+            font=FONT,
+            highlightthickness=1,
+            relief=FLAT,
+        )
+        cell.grid(column=column, row=row, sticky=NSEW)
+        cell.insert(END, str(value))
+        cell.config(readonlybackground="red")
+        return cell
+
+    def __setText(self, cell, value, state):
+        cell.config(state="normal")
+        cell.delete(0, END)
+        cell.insert(END, value)
+        cell.config(state=state)
+
+    def __storeCell(self, i, j):
+        index = self.__top + i
+        if index >= len(self.__data):
+            return
+
+        try:
+            self.__data[index, j] = int(self.__table[i][j].get())
+        except ValueError:
+            pass
+        self.__setText(
+            self.__table[i][j], str(self.__data[index, j]), self.__cellState
+        )
+
+    def __storeVisible(self):
+        for i in range(len(self.__table)):
+            for j in range(len(self.__columns)):
+                self.__storeCell(i, j)
+
+    def __redraw(self):
+        for i, (rowName, row) in enumerate(zip(self.__rows, self.__table)):
+            index = self.__top + i
+            if index >= len(self.__data):
+                rowName.grid_remove()
+                for cell in row:
+                    cell.grid_remove()
+                continue
+
+            rowName.grid()
+            self.__setText(rowName, str(self.__rowNames[index]), "normal")
+            for j, cell in enumerate(row):
+                cell.grid()
+                self.__setText(
+                    cell, str(self.__data[index, j]), self.__cellState
+                )
+
+        total = len(self.__data)
+        if total <= len(self.__table):
+            self.__scrollbar.set(0.0, 1.0)
+        else:
+            self.__scrollbar.set(
+                self.__top / total, (self.__top + len(self.__table)) / total
+            )
+
+    def __scrollTo(self, top):
+        top = max(0, min(top, len(self.__data) - len(self.__table)))
+        if top == self.__top:
+            return
+
+        self.__storeVisible()
+        self.__top = top
+        self.__redraw()
+
+    def __yview(self, *args):
+        match args:
+            case ("moveto", fraction):
+                self.__scrollTo(round(float(fraction) * len(self.__data)))
+            case ("scroll", count, "pages"):
+                self.__scrollTo(self.__top + int(count) * len(self.__table))
+            case ("scroll", count, _):
+                self.__scrollTo(self.__top + int(count))
+
+    def __onWheel(self, event):
+        self.__scrollTo(self.__top + (-1 if event.delta > 0 else 1))
+
+    def grid(self, row, column, padx=0, pady=0, columnspan=1):
+        self.__frameCanvas.grid(
+            column=column,
+            row=row,
+            padx=padx,
+            pady=pady,
+            columnspan=columnspan,
+            sticky="nw",
+        )
+
+    def setTitle(self, text):
+        self.__frameCanvas.configure(text=text)
+
+    def setVisibleRowsCount(self, cnt):
+        self.__storeVisible()
+        self.__visibleRowsCnt = cnt
+        while len(self.__table) < cnt:
+            self.__addVisibleRow()
+        while len(self.__table) > cnt:
+            self.__removeVisibleRow()
+
+        self.__frame.grid_propagate(True)
+        self.__frame.update_idletasks()
+        self.__height = self.__frame.winfo_reqheight()
+        self.__frame.config(height=self.__height)
+        self.__frame.grid_propagate(False)
+        self.__top = max(0, min(self.__top, len(self.__data) - cnt))
+        self.__redraw()
+
+    def rowsCount(self):
+        return len(self.__data)
+
+    def columnsCount(self):
+        return len(self.__columns)
+
+    def width(self):
+        return self.__width
+
+    def height(self):
+        return self.__height
+
+    def visibleRowsCount(self):
+        return self.__visibleRowsCnt
+
+    def visibleColumnsCount(self):
+        return self.__visibleColumnsCnt
+
+    def data(self):
+        self.__storeVisible()
+        return self.__data
+
+    def table(self):
+        return [[str(value) for value in row] for row in self.data().tolist()]
+
+    def setData(self, values, rowNames=None):
+        self.__data = np.array(values, dtype=np.int64).reshape(
+            -1, len(self.__columns)
+        )
+        if rowNames is None:
+            rowNames = np.arange(1, len(self.__data) + 1)
+        self.__rowNames = np.asarray(rowNames)
+        self.__top = 0
+        self.__redraw()
+
+    def setCellState(self, state):
+        self.__cellState = state
+        self.__redraw()
+
+    def setCellValue(self, value, row, column):
+        self.__data[row - 1, column - 1] = int(value)
+        self.__redraw()
+
+    def setRowName(self, row, name):
+        self.__rowNames = self.__rowNames.astype(object)
+        self.__rowNames[row - 1] = name
+        self.__redraw()
+
+    def addRow(self, name, values=[]):
+        self.__storeVisible()
+        row = np.zeros((1, len(self.__columns)), dtype=np.int64)
+        if len(values) != 0:
+            row[0] = values
+        self.__data = np.concatenate((self.__data, row))
+        self.__rowNames = np.append(self.__rowNames.astype(object), name)
+        self.__top = max(0, len(self.__data) - len(self.__table))
+        self.__redraw()
+
+    def removeRow(self, index=None):
+        if not index:
+            index = len(self.__data)
+
+        self.__storeVisible()
+        self.__data = np.delete(self.__data, index - 1, axis=0)
+        self.__rowNames = np.delete(self.__rowNames, index - 1)
+        self.__top = max(0, len(self.__data) - len(self.__table))
+        self.__redraw()
+
+
+def __generateMethod(method, count, step, table, txtRes):
+    if count < 0 or step <= 0:
+        return
+
+    seq = method(count, algs.DIGIT_RANGES)
+
+    rows = np.arange(0, len(seq[0]), step)
+    table.setData(np.column_stack([s[rows] for s in seq]), rowNames=rows + 1)
+
+    # "~" marks a factor estimated from a sample of lags
+    sampled = len(seq[0]) - 2 > APPROVE_LAG_COUNT
+    for i, factor in enumerate(
+        algs.approve_sequences(
+            seq, lag_count=APPROVE_LAG_COUNT, seed=APPROVE_SEED
+        )
+    ):
+        txtRes[i].config(state="normal")
+        txtRes[i].delete(0, END)
+        txtRes[i].insert(
+            END, ("~" if sampled else "") + "{:.2f}".format(factor)
+        )
+        # txtRes[i].config(state="readonly")
+
+
+def calculateManual():
+    # the factor object keeps its per-lag state between clicks, so only
+    # the edited rows are recounted
+    manualFactor.assign(tableManual.data()[:, 0].tolist())
+    try:
+        factor = manualFactor.factor()
+    except ValueError:
+        return
+    txtResManual.config(state="normal")
+    txtResManual.delete(0, END)
+    txtResManual.insert(END, "{:.2f}".format(factor))
+    # txtResManual.config(state="readonly")
+
+
+def openManual():
+    path = filedialog.askopenfilename(
+        filetypes=[("Binary", "*.bin *.dat"), ("Digits", "*.txt"), ("All", "*")]
+    )
+    if not path:
+        return
+
+    values = streams.read_values(
+        streams.map_file(path), streams.guess_format(path), OPEN_VALUE_COUNT
+    )
+    tableManual.setData(values[:, None])
+    calculateManual()
+
+
+def generateAlgorithmic():
+    global tableAlgorithmic, txtResAlgorithmic
+    count = int(txtCountAlgorithmic.get())
+    step = int(txtStepAlgorithmic.get())
+    __generateMethod(
+        algs.generate_linear_congruent_ranges,
+        count,
+        step,
+        tableAlgorithmic,
+        txtResAlgorithmic,
+    )
+
+
+def generateTabular():
+    global tableTabular, txtResTabular
+    count = int(txtCountTabular.get())
+    step = int(txtStepTabular.get())
+    __generateMethod(
+        algs.generate_tabular_ranges,
+        count,
+        step,
+        tableTabular,
+        txtResTabular,
+    )
+
+
+def main():
+    global tableManual, txtResManual
+    global tableTabular, txtCountTabular, txtStepTabular, txtResTabular
+    global tableAlgorithmic, txtCountAlgorithmic, txtStepAlgorithmic
+    global txtResAlgorithmic
+
+    window = Tk()
+
+    window.title("Lab3: Random number generators")
+    window.geometry("720x700")
+    window.resizable(False, False)
+
+    tableManual = YScrollableTable(
+        window, columns=["any"], rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)]
+    )
+    tableManual.setTitle("Manual input: ")
+    tableManual.grid(row=1, column=0, padx=20, pady=10, columnspan=2)
+
+    btnAddManual = Button(
+        window,
+        text="+",
+        width=3,
+        command=lambda: tableManual.addRow(len(tableManual.table()) + 1),
+    )
+    btnAddManual.grid(row=2, column=0, padx=(20, 0), pady=5, sticky="we")
+
+    btnRemoveManual = Button(
+        window, text="-", width=3, command=lambda: tableManual.removeRow()
+    )
+    btnRemoveManual.grid(row=2, column=1, padx=(0, 20), pady=5, sticky="we")
+
+    btnCalcManual = Button(window, text="Calculate", command=calculateManual)
+    btnCalcManual.grid(row=3, column=0, padx=(20, 0), sticky="we")
+
+    btnOpenManual = Button(window, text="Open...", command=openManual)
+    btnOpenManual.grid(row=3, column=1, padx=(0, 20), sticky="we")
+
+    tableTabular = YScrollableTable(
+        window,
+        columns=["1-digit", "2-digit", "3-digit"],
+        rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)],
+    )
+    tableTabular.setTitle("Tabular method: ")
+    tableTabular.grid(row=1, column=2, padx=20, pady=10, columnspan=4)
+    # tableTabular.setCellState("readonly")
+
+    lblCountTabular = Label(window, text="Count:")
+    lblCountTabular.grid(row=2, column=2, padx=(20, 0), pady=5, sticky="we")
+
+    txtCountTabular = Entry(window, font=FONT, width=3)
+    txtCountTabular.grid(row=2, column=3, padx=(0, 0), pady=5, sticky="we")
+    txtCountTabular.insert(END, 100)
+
+    lblStepTabular = Label(window, text="Step:")
+    lblStepTabular.grid(row=2, column=4, padx=(0, 0), pady=5, sticky="we")
+
+    txtStepTabular = Entry(window, font=FONT, width=3)
+    txtStepTabular.grid(row=2, column=5, padx=(0, 20), pady=5, sticky="we")
+    txtStepTabular.insert(END, 1)
+
+    btnCalcTabular = Button(window, text="Calculate", command=generateTabular)
+    btnCalcTabular.grid(row=3, column=2, padx=20, columnspan=4, sticky="we")
+
+    tableAlgorithmic = YScrollableTable(
+        window,
+        columns=["1-digit", "2-digit", "3-digit"],
+        rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)],
+    )
+    tableAlgorithmic.setTitle("Algorithmic method: ")
+    tableAlgorithmic.grid(row=1, column=6, padx=20, pady=10, columnspan=4)
+    # tableAlgorithmic.setCellState(state="readonly")
+
+    lblCountAlgorithmic = Label(window, text="Count:")
+    lblCountAlgorithmic.grid(row=2, column=6, padx=(20, 0), pady=5, sticky="we")
+
+    txtCountAlgorithmic = Entry(window, font=FONT, width=3)
+    txtCountAlgorithmic.grid(row=2, column=7, padx=(0, 0), pady=5, sticky="we")
+    txtCountAlgorithmic.insert(END, 100)
+
+    lblStepAlgorithmic = Label(window, text="Step:")
+    lblStepAlgorithmic.grid(row=2, column=8, padx=(0, 0), pady=5, sticky="we")
+
+    txtStepAlgorithmic = Entry(window, font=FONT, width=3)
+    txtStepAlgorithmic.grid(row=2, column=9, padx=(0, 20), pady=5, sticky="we")
+    txtStepAlgorithmic.insert(END, 1)
+
+    btnCalcAlgorithmic = Button(
+        window, text="Calculate", command=generateAlgorithmic
+    )
+    btnCalcAlgorithmic.grid(row=3, column=6, padx=20, columnspan=4, sticky="we")
+
+    frameResManual = LabelFrame(window, text="Randomness rate:")
+    frameResManual.grid(row=5, column=0, padx=20, pady=20, columnspan=2)
+
+    lblResManual = Label(frameResManual, text="factor: ", width=CELL_WIDTH)
+    lblResManual.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
+
+    txtResManual = Entry(
+        frameResManual,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResManual.grid(row=0, column=1, pady=10, padx=(0, 10), sticky=NSEW)
+    # txtResManual.config(state="readonly")
+
+    frameResTabular = LabelFrame(window, text="Randomness rate:")
+    frameResTabular.grid(row=5, column=2, padx=20, pady=20, columnspan=4)
+
+    lblResTabular = Label(frameResTabular, text="factor: ", width=CELL_WIDTH)
+    lblResTabular.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
+
+    txtResTabular = []
+
+    txtResTabular1 = Entry(
+        frameResTabular,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResTabular1.grid(row=0, column=1, pady=10, sticky=NSEW)
+    # txtResTabular1.config(state="readonly")
+    txtResTabular.append(txtResTabular1)
+
+    txtResTabular2 = Entry(
+        frameResTabular,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResTabular2.grid(row=0, column=2, pady=10, sticky=NSEW)
+    # txtResTabular2.config(state="readonly")
+    txtResTabular.append(txtResTabular2)
+
+    txtResTabular3 = Entry(
+        frameResTabular,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResTabular3.grid(row=0, column=3, pady=10, padx=(0, 10), sticky=NSEW)
+    # txtResTabular3.config(state="readonly")
+    txtResTabular.append(txtResTabular3)
+
+    frameResAlgorithmic = LabelFrame(window, text="Randomness rate:")
+    frameResAlgorithmic.grid(row=5, column=6, padx=20, pady=20, columnspan=6)
+
+    lblResAlgorithmic = Label(
+        frameResAlgorithmic, text="factor: ", width=CELL_WIDTH
+    )
+    lblResAlgorithmic.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
+
+    txtResAlgorithmic = []
+
+    txtResAlgorithmic1 = Entry(
+        frameResAlgorithmic,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResAlgorithmic1.grid(row=0, column=1, padx=(0, 0), pady=10)
+    # txtResAlgorithmic1.config(state="readonly")
+    txtResAlgorithmic.append(txtResAlgorithmic1)
+
+    txtResAlgorithmic2 = Entry(
+        frameResAlgorithmic,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResAlgorithmic2.grid(row=0, column=2, padx=(0, 0), pady=10)
+    # txtResTabular2.config(state="readonly")
+    txtResAlgorithmic.append(txtResAlgorithmic2)
+
+    txtResAlgorithmic3 = Entry(
+        frameResAlgorithmic,
+        width=CELL_WIDTH,
+        font=FONT,
+        highlightthickness=1,
+        relief=FLAT,
+        readonlybackground="green",
+    )
+    txtResAlgorithmic3.grid(row=0, column=3, padx=(0, 10), pady=10)
+    # txtResAlgorithmic3.config(state="readonly")
+    txtResAlgorithmic.append(txtResAlgorithmic3)
+
+    window.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from prng import PseudoRandomGenerator
+
+LANES = 1 << 16
+SUBSTREAM_STRIDE = 1 << 40
+MAX_MODULUS = 1 << 32
+# (m, a, c, x0) used by the lab's linear congruential method
+DEFAULT_PARAMETERS = (312500, 36261, 66037, 60000)
+
+
+class LinearCongruentialGenerator(PseudoRandomGenerator):
+    name = "lcg"
+
+    def __init__(self, m: int, a: int, c: int, x0: int) -> None:
+        if not 0 < m <= MAX_MODULUS:
+            raise ValueError(f"modulus must be in (0, 2**32], got {m}")
+
+        self._m = m
+        self._a = a % m
+        self._c = c % m
+        self._state = x0 % m
+
+    @property
+    def raw_range(self) -> int:
+        return self._m
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    def _jump(self, n: int) -> tuple[int, int]:
+        # coefficients of x -> a^n x + c (a^n - 1) / (a - 1) mod m, built
+        # by repeated squaring of the one-step map
+        mult, inc = 1, 0
+        a, c = self._a, self._c
+        while n:
+            if n & 1:
+                mult, inc = (mult * a) % self._m, (inc * a + c) % self._m
+            c = (c * (a + 1)) % self._m
+            a = (a * a) % self._m
+            n >>= 1
+        return mult, inc
+
+    def skip(self, n: int) -> None:
+        mult, inc = self._jump(n)
+        self._state = (mult * self._state + inc) % self._m
+
+    def substream(
+        self, index: int, stride: int = SUBSTREAM_STRIDE
+    ) -> "LinearCongruentialGenerator":
+        stream = LinearCongruentialGenerator(
+            self._m, self._a, self._c, self._state
+        )
+        stream.skip(index * stride)
+        return stream
+
+    def random_raw(self, count: int) -> NDArray[np.int64]:
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        m = np.uint64(self._m)
+        lanes = min(count, LANES)
+
+        # lane k starts at x_{k+1}; lanes are doubled with jumps of their
+        # own length so no value is computed serially
+        starts = np.array(
+            [(self._a * self._state + self._c) % self._m], dtype=np.uint64
+        )
+        while len(starts) < lanes:
+            mult, inc = self._jump(len(starts))
+            starts = np.concatenate(
+                (starts, (np.uint64(mult) * starts + np.uint64(inc)) % m)
+            )
+
+        steps = -(-count // lanes)
+        out = np.empty((steps, lanes), dtype=np.uint64)
+        out[0] = starts[:lanes]
+
+        mult, inc = (np.uint64(k) for k in self._jump(lanes))
+        for step in range(1, steps):
+            np.multiply(out[step - 1], mult, out=out[step])
+            out[step] += inc
+            out[step] %= m
+
+        values = out.ravel()[:count]
+        self._state = int(values[-1])
+        return values.astype(np.int64)
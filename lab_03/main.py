@@ -1,457 +1,330 @@
-from tkinter import *
-import algs
-from math import ceil
-
-DEFAULT_ROWS_COUNT = 25
-CELL_WIDTH = 5
-FONT = ("Arial", 15)
-
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO, TextIO
 
-class YScrollableTable:
-    def __init__(self, window, columns, rows):
-        self.__cellState = "normal"
-        self.__visibleRowsCnt = 15
-        self.__visibleColumnsCnt = len(columns)
+import click
+import numpy as np
+from numpy.typing import NDArray
 
-        self.__frameCanvas = LabelFrame(window)
-        self.__frameCanvas.grid(column=0, row=0, sticky="nw")
-        self.__canvas = Canvas(
-            self.__frameCanvas, borderwidth=0, highlightthickness=0
-        )
-        self.__canvas.grid(
-            row=0, column=0, sticky="news", padx=(5, 0), pady=(5, 5)
-        )
+import algs
+import benchmark
+import search
+import streams
+from generators import GENERATORS, make_generator
+from lcg import LinearCongruentialGenerator
+from quality import Battery
+
+SOURCES = ("tabular", "file", *GENERATORS)
+
+
+def read_sequence(path: str) -> NDArray[np.int64]:
+    if path.endswith(".npy"):
+        return np.load(path).astype(np.int64).ravel()
+    return np.loadtxt(path, dtype=np.int64, ndmin=1).ravel()
+
+
+def iter_runs(
+    source: str,
+    count: int,
+    ranges: Sequence[tuple[int, int]],
+    runs: int,
+    seed: int | None,
+    offset: int,
+    file: str | None,
+    parameters: algs.LcgParameters | None = None,
+) -> Iterator[list[tuple[tuple[int, int], NDArray[np.int64]]]]:
+    if source == "file":
+        seq = read_sequence(file)
+        yield [((int(seq.min()), int(seq.max()) + 1), seq)]
+        return
 
-        self.__scrollbar = Scrollbar(
-            self.__frameCanvas, orient="vertical", command=self.__canvas.yview
-        )
-        self.__scrollbar.grid(row=0, column=1, sticky="ns", padx=0, pady=5)
-        self.__canvas.configure(yscrollcommand=self.__scrollbar.set)
-
-        self.__frame = Frame(self.__canvas)
-        self.__canvas.create_window((0, 0), window=self.__frame, anchor="nw")
-
-        self.__table = []
-        self.__columns = []
-        self.__rows = []
-        cell = self.__createLabelCell(row=0, column=0)
-        for i, rowName in enumerate(rows):
-            row = []
-            cell = self.__createLabelCell(row=i + 1, column=0, value=rowName)
-            self.__rows.append(cell)
-            for j, columnName in enumerate(columns):
-                cell = self.__createLabelCell(
-                    row=0, column=j + 1, value=columnName
-                )
-                if i == 0:
-                    self.__columns.append(cell)
-
-                cell = self.__createTableCell(row=i + 1, column=j + 1, value=0)
-                row.append(cell)
-            self.__table.append(row)
-        self.__frame.update_idletasks()
-
-        self.__width = (
-            self.__table[0][0].winfo_width() * self.__visibleColumnsCnt
-            + self.__rows[0].winfo_width()
-        )
-        self.__height = (
-            self.__table[0][0].winfo_height() * self.__visibleRowsCnt
-            + self.__columns[0].winfo_height()
-        )
-        self.__canvas.config(width=self.__width, height=self.__height)
-        self.__canvas.configure(scrollregion=self.__canvas.bbox("all"))
-
-    def __createTableCell(self, row, column, value=0):
-        cell = Entry(
-            self.__frame,
-            width=CELL_WIDTH,
-            font=FONT,
-            fg="blue",
-            highlightthickness=1,
-            relief=FLAT,
-        )
-        cell.insert(END, str(value))
-        cell.grid(column=column, row=row, sticky=NSEW)
-        cell.config(state=self.__cellState, readonlybackground="red")
-        return cell
-
-    def __createLabelCell(self, row, column, value=""):
-        cell = Entry(
-            self.__frame,
-            width=CELL_WIDTH,
-            font=FONT,
-            highlightthickness=1,
-            relief=FLAT,
-        )
-        cell.grid(column=column, row=row, sticky=NSEW)
-        cell.insert(END, str(value))
-        cell.config(readonlybackground="red")
-        return cell
-
-    def grid(self, row, column, padx=0, pady=0, columnspan=1):
-        self.__frameCanvas.grid(
-            column=column,
-            row=row,
-            padx=padx,
-            pady=pady,
-            columnspan=columnspan,
-            sticky="nw",
+    # consecutive runs take consecutive blocks of one stream
+    generator = None
+    if parameters is not None:
+        m, a, c, x0 = parameters
+        generator = LinearCongruentialGenerator(
+            m, a, c, x0 if seed is None else seed
         )
-
-    def setTitle(self, text):
-        self.__frameCanvas.configure(text=text)
-
-    def setVisibleRowsCount(self, cnt):
-        self.__visibleRowsCnt = cnt
-        self.__height = (
-            sum(
+    elif source != "tabular":
+        generator = make_generator(source, seed)
+    for run in range(runs):
+        if generator is None:
+            seqs = algs.generate_tabular_ranges(
+                count, ranges, offset + run * count
+            )
+        else:
+            seqs = generator.generate_ranges(count, ranges)
+        yield list(zip(ranges, seqs))
+
+
+def evaluate_sequence(
+    seq: NDArray[np.int64], low: int, high: int, lag_count: int | None
+) -> dict:
+    battery = Battery(low, high)
+    battery.update(seq)
+    return {
+        "low": low,
+        "high": high,
+        "factor": algs.approve_sequence(seq, lag_count),
+        "p_values": battery.report(),
+    }
+
+
+def save_results(path: str, results: list[list[dict]]) -> None:
+    if path.endswith(".npz"):
+        tests = list(results[0][0]["p_values"])
+        np.savez(
+            path,
+            ranges=np.array([[r["low"], r["high"]] for r in results[0]]),
+            tests=np.array(tests),
+            factors=np.array([[r["factor"] for r in run] for run in results]),
+            p_values=np.array(
                 [
-                    self.__table[i][0].winfo_height()
-                    for i in range(self.__visibleRowsCnt)
+                    [[r["p_values"][test] for test in tests] for r in run]
+                    for run in results
                 ]
-            )
-            + self.__columns[0].winfo_height()
+            ),
         )
-        self.__canvas.config(height=self.__height)
-        self.__canvas.configure(scrollregion=self.__canvas.bbox("all"))
-
-    def rowsCount(self):
-        return len(self.__rows)
-
-    def columnsCount(self):
-        return len(self.__columns)
-
-    def width(self):
-        return self.__width
-
-    def height(self):
-        return self.__height
-
-    def visibleRowsCount(self):
-        return self.__visibleRowsCnt
-
-    def visibleColumnsCount(self):
-        return self.__visibleColumnsCnt
-
-    def table(self):
-        return [[cell.get() for cell in row] for row in self.__table]
-
-    def setCellState(self, state):
-        self.__cellState = state
-        for row in self.__table:
-            for cell in row:
-                cell.config(state=self.__cellState)
-
-    def setCellValue(self, value, row, column):
-        self.__table[row - 1][column - 1].config(state="normal")
-        self.__table[row - 1][column - 1].delete(0, END)
-        self.__table[row - 1][column - 1].insert(END, value)
-        self.__table[row - 1][column - 1].config(state=self.__cellState)
-
-    def setRowName(self, row, name):
-        self.__rows[row - 1].config(state="normal")
-        self.__rows[row - 1].delete(0, END)
-        self.__rows[row - 1].insert(END, name)
-        # self.__rows[row - 1].config(state="readonly")
-
-    def addRow(self, name, values=[]):
-        i = len(self.__rows)
-        cell = self.__createLabelCell(row=i + 1, column=0, value=name)
-        self.__rows.append(cell)
-
-        row = []
-        for j in range(len(self.__columns)):
-            cell = self.__createTableCell(row=i + 1, column=j + 1, value=0)
-            cell.config(state="normal")
-            cell.delete(0, END)
-            if len(values) != 0:
-                cell.insert(END, values[j])
-            else:
-                cell.insert(END, 0)
-            cell.config(state=self.__cellState)
-            row.append(cell)
-        self.__table.append(row)
-
-        self.__canvas.update_idletasks()
-        self.__canvas.configure(scrollregion=self.__canvas.bbox("all"))
-        self.__canvas.yview_moveto("1.0")
-
-    def removeRow(self, index=None):
-        if not index:
-            index = len(self.__rows)
-
-        self.__rows[index - 1].destroy()
-        del self.__rows[index - 1]
-        for cell in self.__table[index - 1]:
-            cell.destroy()
-        del self.__table[index - 1]
-
-        self.__canvas.update_idletasks()
-        self.__canvas.configure(scrollregion=self.__canvas.bbox("all"))
-        self.__canvas.yview_moveto("1.0")
-
-
-def __generateMethod(method, count, step, table, txtRes):
-    if count < 0 or step < 0:
         return
 
-    seq1digit = method(count, 0, 10)
-    seq2digit = method(count, 10, 100)
-    seq3digit = method(count, 100, 1000)
-
-    seq = []
-    seq.append(seq1digit)
-    seq.append(seq2digit)
-    seq.append(seq3digit)
-
-    columnsCount = table.columnsCount()
-    iSeq = 0
-    iRow = 0
-    while iSeq < count:
-        if iRow >= table.rowsCount():
-            table.addRow(
-                name=str(iSeq + 1),
-                values=[seq[j][iSeq] for j in range(columnsCount)],
-            )
-        else:
-            table.setRowName(row=iRow + 1, name=str(iSeq + 1))
-            for j in range(columnsCount):
-                table.setCellValue(seq[j][iSeq], iRow + 1, j + 1)
-        iRow += 1
-        iSeq += step
-
-    while table.rowsCount() > ceil(count / step):
-        table.removeRow()
-
-    for i, s in enumerate(seq):
-        factor = algs.approve_sequence(s)
-        txtRes[i].config(state="normal")
-        txtRes[i].delete(0, END)
-        txtRes[i].insert(END, "{:.2f}".format(factor))
-        # txtRes[i].config(state="readonly")
-
-
-def calculateManual():
-    seq = list(map(lambda n: int(n[0]), tableManual.table()))
-    print(seq)
-    factor = algs.approve_sequence(seq)
-    txtResManual.config(state="normal")
-    txtResManual.delete(0, END)
-    txtResManual.insert(END, "{:.2f}".format(factor))
-    # txtResManual.config(state="readonly")
-
-
-def generateAlgorithmic():
-    global tableAlgorithmic, txtResAlgorithmic
-    count = int(txtCountAlgorithmic.get())
-    step = int(txtStepAlgorithmic.get())
-    __generateMethod(
-        algs.generate_linear_congruent,
-        count,
-        step,
-        tableAlgorithmic,
-        txtResAlgorithmic,
-    )
-
-
-def generateTabular():
-    global tableTabular, txtResTabular
-    count = int(txtCountTabular.get())
-    step = int(txtStepTabular.get())
-    __generateMethod(
-        algs.generate_tabular, count, step, tableTabular, txtResTabular
-    )
-
-
-window = Tk()
-
-window.title("Lab3: Random number generators")
-window.geometry("720x700")
-window.resizable(False, False)
-
-tableManual = YScrollableTable(
-    window, columns=["any"], rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)]
-)
-tableManual.setTitle("Manual input: ")
-tableManual.grid(row=1, column=0, padx=20, pady=10, columnspan=2)
-
-btnAddManual = Button(
-    window,
-    text="+",
-    width=3,
-    command=lambda: tableManual.addRow(len(tableManual.table()) + 1),
-)
-btnAddManual.grid(row=2, column=0, padx=(20, 0), pady=5, sticky="we")
-
-btnRemoveManual = Button(
-    window, text="-", width=3, command=lambda: tableManual.removeRow()
-)
-btnRemoveManual.grid(row=2, column=1, padx=(0, 20), pady=5, sticky="we")
-
-btnCalcManual = Button(window, text="Calculate", command=calculateManual)
-btnCalcManual.grid(row=3, column=0, padx=20, columnspan=2, sticky="we")
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
 
-tableTabular = YScrollableTable(
-    window,
-    columns=["1-digit", "2-digit", "3-digit"],
-    rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)],
-)
-tableTabular.setTitle("Tabular method: ")
-tableTabular.grid(row=1, column=2, padx=20, pady=10, columnspan=4)
-# tableTabular.setCellState("readonly")
 
-lblCountTabular = Label(window, text="Count:")
-lblCountTabular.grid(row=2, column=2, padx=(20, 0), pady=5, sticky="we")
+@click.group(invoke_without_command=True)
+@click.pass_context
+def cli(ctx: click.Context) -> None:
+    if ctx.invoked_subcommand is None:
+        ctx.invoke(gui)
 
-txtCountTabular = Entry(window, font=FONT, width=3)
-txtCountTabular.grid(row=2, column=3, padx=(0, 0), pady=5, sticky="we")
-txtCountTabular.insert(END, 100)
 
-lblStepTabular = Label(window, text="Step:")
-lblStepTabular.grid(row=2, column=4, padx=(0, 0), pady=5, sticky="we")
+@cli.command(help="Open the Tk window")
+def gui() -> None:
+    import gui as window
 
-txtStepTabular = Entry(window, font=FONT, width=3)
-txtStepTabular.grid(row=2, column=5, padx=(0, 20), pady=5, sticky="we")
-txtStepTabular.insert(END, 1)
+    window.main()
 
-btnCalcTabular = Button(window, text="Calculate", command=generateTabular)
-btnCalcTabular.grid(row=3, column=2, padx=20, columnspan=4, sticky="we")
 
-tableAlgorithmic = YScrollableTable(
-    window,
-    columns=["1-digit", "2-digit", "3-digit"],
-    rows=[i + 1 for i in range(DEFAULT_ROWS_COUNT)],
+@cli.command(help="Generate sequences and score them without a display")
+@click.option(
+    "-source",
+    type=click.Choice(SOURCES),
+    default="tabular",
+    help="Tabular digits, a sequence file or a generator backend",
 )
-tableAlgorithmic.setTitle("Algorithmic method: ")
-tableAlgorithmic.grid(row=1, column=6, padx=20, pady=10, columnspan=4)
-# tableAlgorithmic.setCellState(state="readonly")
-
-lblCountAlgorithmic = Label(window, text="Count:")
-lblCountAlgorithmic.grid(row=2, column=6, padx=(20, 0), pady=5, sticky="we")
-
-txtCountAlgorithmic = Entry(window, font=FONT, width=3)
-txtCountAlgorithmic.grid(row=2, column=7, padx=(0, 0), pady=5, sticky="we")
-txtCountAlgorithmic.insert(END, 100)
-
-lblStepAlgorithmic = Label(window, text="Step:")
-lblStepAlgorithmic.grid(row=2, column=8, padx=(0, 0), pady=5, sticky="we")
-
-txtStepAlgorithmic = Entry(window, font=FONT, width=3)
-txtStepAlgorithmic.grid(row=2, column=9, padx=(0, 20), pady=5, sticky="we")
-txtStepAlgorithmic.insert(END, 1)
-
-btnCalcAlgorithmic = Button(
-    window, text="Calculate", command=generateAlgorithmic
+@click.option("-count", type=int, default=1000, help="Values per sequence")
+@click.option("-runs", type=int, default=1, help="Consecutive evaluations")
+@click.option("-seed", type=int, default=None, help="Generator seed")
+@click.option("-offset", type=int, default=0, help="Tabular start offset")
+@click.option(
+    "-file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Whitespace-separated integers or .npy (for -source file)",
 )
-btnCalcAlgorithmic.grid(row=3, column=6, padx=20, columnspan=4, sticky="we")
-
-frameResManual = LabelFrame(window, text="Randomness rate:")
-frameResManual.grid(row=5, column=0, padx=20, pady=20, columnspan=2)
-
-lblResManual = Label(frameResManual, text="factor: ", width=CELL_WIDTH)
-lblResManual.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
-
-txtResManual = Entry(
-    frameResManual,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+@click.option(
+    "-lag_count",
+    type=int,
+    default=None,
+    help="Score approve_sequence on a sample of lags",
 )
-txtResManual.grid(row=0, column=1, pady=10, padx=(0, 10), sticky=NSEW)
-# txtResManual.config(state="readonly")
-
+@click.option(
+    "-lcg_parameters",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Best parameters saved by `search` (for -source lcg)",
+)
+@click.option(
+    "-output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write results to .json or .npz instead of printing them",
+)
+def evaluate(
+    source: str,
+    count: int,
+    runs: int,
+    seed: int | None,
+    offset: int,
+    file: str | None,
+    lag_count: int | None,
+    lcg_parameters: str | None,
+    output: str | None,
+) -> None:
+    if source == "file" and file is None:
+        raise click.UsageError("-source file needs -file")
+
+    parameters = None
+    if lcg_parameters is not None:
+        if source != "lcg":
+            raise click.UsageError("-lcg_parameters needs -source lcg")
+        try:
+            parameters = search.best_parameters(Path(lcg_parameters))
+        except ValueError as error:
+            raise click.UsageError(str(error)) from None
+
+    results = [
+        [
+            evaluate_sequence(seq, low, high, lag_count)
+            for (low, high), seq in run
+        ]
+        for run in iter_runs(
+            source,
+            count,
+            algs.DIGIT_RANGES,
+            runs,
+            seed,
+            offset,
+            file,
+            parameters,
+        )
+    ]
 
-frameResTabular = LabelFrame(window, text="Randomness rate:")
-frameResTabular.grid(row=5, column=2, padx=20, pady=20, columnspan=4)
+    if output is not None:
+        save_results(output, results)
+        return
 
-lblResTabular = Label(frameResTabular, text="factor: ", width=CELL_WIDTH)
-lblResTabular.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
+    for idx, run in enumerate(results):
+        click.secho(f"run {idx + 1}", bold=True)
+        for res in run:
+            p_values = ", ".join(
+                f"{test} {p:.3f}" for test, p in res["p_values"].items()
+            )
+            click.echo(
+                f"  [{res['low']}, {res['high']}): "
+                f"factor {res['factor']:.4f}; {p_values}"
+            )
 
-txtResTabular = []
 
-txtResTabular1 = Entry(
-    frameResTabular,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
-)
-txtResTabular1.grid(row=0, column=1, pady=10, sticky=NSEW)
-# txtResTabular1.config(state="readonly")
-txtResTabular.append(txtResTabular1)
-
-txtResTabular2 = Entry(
-    frameResTabular,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+@cli.command(
+    "search",
+    help="Look for LCG parameters with a good lattice (squarefree moduli are"
+    " skipped: they only allow a = 1)",
 )
-txtResTabular2.grid(row=0, column=2, pady=10, sticky=NSEW)
-# txtResTabular2.config(state="readonly")
-txtResTabular.append(txtResTabular2)
-
-txtResTabular3 = Entry(
-    frameResTabular,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+@click.option("-candidates", type=int, default=10_000, help="(m, a, c) sets")
+@click.option("-m_low", type=int, default=100_000, help="Smallest modulus")
+@click.option("-m_high", type=int, default=1_000_000, help="Largest modulus")
+@click.option("-top", type=int, default=search.TOP_COUNT, help="Sets to keep")
+@click.option("-seed", type=int, default=None, help="Candidate sampler seed")
+@click.option("-workers", type=int, default=None, help="Worker processes")
+@click.option(
+    "-output",
+    type=click.Path(dir_okay=False),
+    default=str(search.BEST_PATH),
+    help="JSON file the best sets are merged into",
 )
-txtResTabular3.grid(row=0, column=3, pady=10, padx=(0, 10), sticky=NSEW)
-# txtResTabular3.config(state="readonly")
-txtResTabular.append(txtResTabular3)
+def search_parameters(
+    candidates: int,
+    m_low: int,
+    m_high: int,
+    top: int,
+    seed: int | None,
+    workers: int | None,
+    output: str,
+) -> None:
+    try:
+        best = search.search(
+            candidates, m_low, m_high, top, seed, workers, Path(output)
+        )
+    except ValueError as error:
+        raise click.UsageError(str(error)) from None
+    for result in best:
+        click.echo(
+            f"m={result['m']} a={result['a']} c={result['c']}: "
+            f"merit {result['merit']:.4f}, factor {result['factor']:.4f}"
+        )
 
-frameResAlgorithmic = LabelFrame(window, text="Randomness rate:")
-frameResAlgorithmic.grid(row=5, column=6, padx=20, pady=20, columnspan=6)
 
-lblResAlgorithmic = Label(
-    frameResAlgorithmic, text="factor: ", width=CELL_WIDTH
+@cli.command(help="Write raw generator output to a file or stdout")
+@click.option(
+    "-generator",
+    "name",
+    type=click.Choice(sorted(GENERATORS)),
+    default="pcg64",
+    help="Generator backend",
 )
-lblResAlgorithmic.grid(row=0, column=0, pady=10, padx=(10, 0), sticky=NSEW)
-
-txtResAlgorithmic = []
-
-txtResAlgorithmic1 = Entry(
-    frameResAlgorithmic,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+@click.option("-count", type=int, default=1 << 30, help="Bytes to write")
+@click.option("-seed", type=int, default=None, help="Generator seed")
+@click.option(
+    "-format",
+    "fmt",
+    type=click.Choice(streams.FORMATS),
+    default="bytes",
+    help="Uniform bytes or ASCII decimal digits",
 )
-txtResAlgorithmic1.grid(row=0, column=1, padx=(0, 0), pady=10)
-# txtResAlgorithmic1.config(state="readonly")
-txtResAlgorithmic.append(txtResAlgorithmic1)
-
-txtResAlgorithmic2 = Entry(
-    frameResAlgorithmic,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+@click.option(
+    "-output",
+    type=click.File("wb"),
+    default="-",
+    help="Destination file (stdout by default)",
 )
-txtResAlgorithmic2.grid(row=0, column=2, padx=(0, 0), pady=10)
-# txtResTabular2.config(state="readonly")
-txtResAlgorithmic.append(txtResAlgorithmic2)
-
-txtResAlgorithmic3 = Entry(
-    frameResAlgorithmic,
-    width=CELL_WIDTH,
-    font=FONT,
-    highlightthickness=1,
-    relief=FLAT,
-    readonlybackground="green",
+def stream(
+    name: str, count: int, seed: int | None, fmt: str, output: BinaryIO
+) -> None:
+    streams.write_stream(make_generator(name, seed), count, output, fmt)
+
+
+@cli.command(help="Score a binary or digit-text file without loading it")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-format",
+    "fmt",
+    type=click.Choice(streams.READ_FORMATS),
+    default=None,
+    help="One value per byte, one per ASCII digit, or digits after the "
+    "first column of each line (guessed from the file by default)",
 )
-txtResAlgorithmic3.grid(row=0, column=3, padx=(0, 10), pady=10)
-# txtResAlgorithmic3.config(state="readonly")
-txtResAlgorithmic.append(txtResAlgorithmic3)
-
-window.mainloop()
+@click.option(
+    "-count",
+    type=int,
+    default=10_000,
+    help="Leading values passed to approve_sequence",
+)
+@click.option(
+    "-lag_count",
+    type=int,
+    default=None,
+    help="Score approve_sequence on a sample of lags",
+)
+def check(
+    file: str, fmt: str | None, count: int, lag_count: int | None
+) -> None:
+    fmt = fmt or streams.guess_format(file)
+    mapped = streams.map_file(file)
+    low, high = streams.RANGES[fmt]
+
+    values = streams.read_values(mapped, fmt, count)
+    if len(values) < 3:
+        raise click.UsageError(f"{file} holds fewer than 3 values")
+
+    # the battery streams the whole mapping; the factor is quadratic, so
+    # it only sees the first values
+    battery = Battery(low, high)
+    for chunk in streams.iter_values(mapped, fmt):
+        battery.update(chunk)
+    factor = algs.approve_sequence(values, lag_count)
+
+    click.echo(f"factor {factor:.4f}")
+    for test, p_value in battery.report().items():
+        color = "red" if p_value < 0.01 else None
+        click.secho(f"  {test:<16} p = {p_value:.4f}", fg=color)
+
+
+@cli.command(help="Running randomness factor of integers read from a file")
+@click.argument("file", type=click.File(), default="-")
+@click.option("-every", type=int, default=1, help="Print after every N values")
+def factor(file: TextIO, every: int) -> None:
+    running = algs.RandomnessFactor()
+    for line in file:
+        for token in line.split():
+            running.append(int(token))
+            if len(running) >= 3 and len(running) % every == 0:
+                click.echo(f"{len(running)}: {running.factor():.4f}")
+
+
+cli.add_command(benchmark.main, "benchmark")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class PseudoRandomGenerator(ABC):
+    name: str
+
+    @property
+    @abstractmethod
+    def raw_range(self) -> int: ...
+
+    @abstractmethod
+    def random_raw(self, count: int) -> NDArray[np.integer]: ...
+
+    def generate(
+        self, count: int, low: int = 0, high: int = 100
+    ) -> NDArray[np.int64]:
+        return self.generate_ranges(count, [(low, high)])[0]
+
+    def generate_ranges(
+        self, count: int, ranges: Sequence[tuple[int, int]]
+    ) -> list[NDArray[np.int64]]:
+        spans = [high - low for low, high in ranges]
+        for (low, high), span in zip(ranges, spans):
+            if not 0 < span <= self.raw_range:
+                raise ValueError(
+                    f"range [{low}, {high}) does not fit the generator"
+                )
+
+        # raw values past the last whole multiple of span are rejected, so
+        # every residue is equally likely; rejected values are simply
+        # skipped, which keeps the output independent of the chunking and
+        # lets every range be cut from the same raw stream
+        limits = [self.raw_range - self.raw_range % span for span in spans]
+        outs = [np.empty(count, dtype=np.int64) for _ in ranges]
+        filled = [0] * len(ranges)
+        while min(filled, default=count) < count:
+            raw = self.random_raw(count - min(filled))
+            for idx, (span, limit) in enumerate(zip(spans, limits)):
+                accepted = raw
+                if limit < self.raw_range:
+                    accepted = raw[raw < np.asarray(limit, dtype=raw.dtype)]
+                accepted = accepted[: count - filled[idx]]
+
+                end = filled[idx] + len(accepted)
+                outs[idx][filled[idx] : end] = accepted % np.asarray(
+                    span, dtype=raw.dtype
+                )
+                filled[idx] = end
+
+        return [low + out for (low, _), out in zip(ranges, outs)]
@@ -0,0 +1,283 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from math import comb, factorial, perm
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft, stats
+
+MIN_EXPECTED = 5.0
+POKER_HAND = 5
+GAP_LIMIT = 10
+MAX_LAG = 100
+
+
+def _chi_square(
+    observed: NDArray[np.float64], probs: NDArray[np.float64]
+) -> float:
+    total = observed.sum()
+    if total == 0:
+        return float("nan")
+
+    # neighbouring categories are merged until each expects enough hits
+    merged_obs: list[float] = []
+    merged_exp: list[float] = []
+    obs_acc = exp_acc = 0.0
+    for obs, prob in zip(observed, probs):
+        obs_acc += obs
+        exp_acc += prob * total
+        if exp_acc >= MIN_EXPECTED:
+            merged_obs.append(obs_acc)
+            merged_exp.append(exp_acc)
+            obs_acc = exp_acc = 0.0
+    if merged_obs:
+        merged_obs[-1] += obs_acc
+        merged_exp[-1] += exp_acc
+
+    if len(merged_obs) < 2:
+        return float("nan")
+
+    statistic = stats.chisquare(merged_obs, merged_exp).statistic
+    return float(stats.chi2.sf(statistic, len(merged_obs) - 1))
+
+
+def _stirling2(n: int, k: int) -> int:
+    terms = ((-1) ** i * comb(k, i) * (k - i) ** n for i in range(k + 1))
+    return sum(terms) // factorial(k)
+
+
+class StreamTest(ABC):
+    name: str
+
+    def __init__(self, low: int, high: int) -> None:
+        self._low = low
+        self._size = high - low
+
+    @abstractmethod
+    def update(self, chunk: NDArray[np.int64]) -> None: ...
+
+    @abstractmethod
+    def p_value(self) -> float: ...
+
+
+class FrequencyTest(StreamTest):
+    name = "frequency"
+
+    def __init__(self, low: int, high: int) -> None:
+        super().__init__(low, high)
+        self._counts = np.zeros(self._size)
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        self._counts += np.bincount(chunk - self._low, minlength=self._size)
+
+    def p_value(self) -> float:
+        probs = np.full(self._size, 1.0 / self._size)
+        return _chi_square(self._counts, probs)
+
+
+class SerialTest(StreamTest):
+    name = "serial"
+
+    def __init__(self, low: int, high: int) -> None:
+        super().__init__(low, high)
+        self._counts = np.zeros(self._size**2)
+        self._rest = np.empty(0, dtype=np.int64)
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        values = np.concatenate((self._rest, chunk - self._low))
+        pairs = len(values) // 2
+        self._rest = values[2 * pairs :]
+
+        cells = (
+            values[0 : 2 * pairs : 2] * self._size + values[1 : 2 * pairs : 2]
+        )
+        self._counts += np.bincount(cells, minlength=self._size**2)
+
+    def p_value(self) -> float:
+        probs = np.full(self._size**2, 1.0 / self._size**2)
+        return _chi_square(self._counts, probs)
+
+
+class RunsUpDownTest(StreamTest):
+    name = "runs up/down"
+
+    def __init__(self, low: int, high: int, seed: int = 0) -> None:
+        super().__init__(low, high)
+        # spreading each integer uniformly over its unit cell removes ties,
+        # so the moments of the continuous case apply
+        self._rng = np.random.default_rng(seed)
+        self._last: float | None = None
+        self._last_sign = 0
+        self._steps = 0
+        self._runs = 0
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        if not len(chunk):
+            return
+
+        values = chunk + self._rng.random(len(chunk))
+        if self._last is not None:
+            values = np.r_[self._last, values]
+        self._last = float(values[-1])
+
+        signs = np.sign(np.diff(values))
+        if not len(signs):
+            return
+
+        self._steps += len(signs)
+        self._runs += int(np.count_nonzero(signs[1:] != signs[:-1]))
+        self._runs += int(signs[0] != self._last_sign)
+        self._last_sign = int(signs[-1])
+
+    def p_value(self) -> float:
+        count = self._steps + 1
+        if count < 3:
+            return float("nan")
+
+        mean = (2 * count - 1) / 3
+        std = np.sqrt((16 * count - 29) / 90)
+        return float(2 * stats.norm.sf(abs(self._runs - mean) / std))
+
+
+class GapTest(StreamTest):
+    name = "gap"
+
+    def __init__(self, low: int, high: int, limit: int = GAP_LIMIT) -> None:
+        super().__init__(low, high)
+        # a value is marked when it falls into the lower half of the range
+        self._marked = max(1, self._size // 2)
+        self._limit = limit
+        self._counts = np.zeros(limit + 1)
+        self._gap: int | None = None
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        hits = np.flatnonzero(chunk - self._low < self._marked)
+        if not len(hits):
+            if self._gap is not None:
+                self._gap += len(chunk)
+            return
+
+        gaps = np.diff(hits) - 1
+        if self._gap is not None:
+            gaps = np.r_[self._gap + hits[0], gaps]
+        self._gap = len(chunk) - 1 - hits[-1]
+
+        self._counts += np.bincount(
+            np.minimum(gaps, self._limit), minlength=self._limit + 1
+        )
+
+    def p_value(self) -> float:
+        prob = self._marked / self._size
+        probs = prob * (1 - prob) ** np.arange(self._limit + 1)
+        probs[-1] = (1 - prob) ** self._limit
+        return _chi_square(self._counts, probs)
+
+
+class PokerTest(StreamTest):
+    name = "poker"
+
+    def __init__(self, low: int, high: int, hand: int = POKER_HAND) -> None:
+        super().__init__(low, high)
+        self._hand = hand
+        self._counts = np.zeros(hand + 1)
+        self._rest = np.empty(0, dtype=np.int64)
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        values = np.concatenate((self._rest, chunk - self._low))
+        hands = len(values) // self._hand
+        self._rest = values[hands * self._hand :]
+
+        cards = np.sort(values[: hands * self._hand].reshape(hands, -1), axis=1)
+        distinct = 1 + np.count_nonzero(np.diff(cards, axis=1), axis=1)
+        self._counts += np.bincount(distinct, minlength=self._hand + 1)
+
+    def p_value(self) -> float:
+        probs = np.array(
+            [
+                perm(self._size, r)
+                * _stirling2(self._hand, r)
+                / self._size**self._hand
+                for r in range(self._hand + 1)
+            ]
+        )
+        return _chi_square(self._counts[1:], probs[1:])
+
+
+class AutocorrelationTest(StreamTest):
+    name = "autocorrelation"
+
+    def __init__(self, low: int, high: int, max_lag: int = MAX_LAG) -> None:
+        super().__init__(low, high)
+        self._max_lag = max_lag
+        # the uniform mean and variance are known, so one pass suffices
+        self._mean = (self._size - 1) / 2
+        self._variance = (self._size**2 - 1) / 12
+        self._sums = np.zeros(max_lag + 1)
+        self._count = 0
+        self._tail = np.empty(0)
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        centered = chunk - self._low - self._mean
+        window = np.concatenate((self._tail, centered))
+        size = fft.next_fast_len(len(window) + len(centered))
+
+        # products of every new value with the window values up to
+        # max_lag positions before it
+        spectrum = fft.rfft(window, size).conj() * fft.rfft(centered, size)
+        products = fft.irfft(spectrum, size)
+        lags = np.arange(self._max_lag + 1)
+        sums = products[(lags - len(window) + len(centered)) % size]
+        # lags past the start of the stream have no pairs yet; their
+        # indices wrap into the negative shifts
+        sums[lags >= len(window)] = 0.0
+        self._sums += sums
+
+        self._count += len(centered)
+        self._tail = window[-self._max_lag :] if self._max_lag else self._tail
+
+    def p_value(self) -> float:
+        lags = np.arange(1, self._max_lag + 1)
+        count = self._count - lags
+        if self._variance == 0 or (count <= 0).any():
+            return float("nan")
+
+        corr = self._sums[1:] / (count * self._variance)
+        statistic = np.sum(count * corr**2)
+        return float(stats.chi2.sf(statistic, self._max_lag))
+
+
+TESTS: tuple[type[StreamTest], ...] = (
+    FrequencyTest,
+    SerialTest,
+    RunsUpDownTest,
+    GapTest,
+    PokerTest,
+    AutocorrelationTest,
+)
+
+
+class Battery:
+    def __init__(
+        self,
+        low: int,
+        high: int,
+        tests: Iterable[type[StreamTest]] = TESTS,
+    ) -> None:
+        self._tests = [test(low, high) for test in tests]
+
+    def update(self, chunk: NDArray[np.int64]) -> None:
+        chunk = np.asarray(chunk, dtype=np.int64)
+        for test in self._tests:
+            test.update(chunk)
+
+    def report(self) -> dict[str, float]:
+        return {test.name: test.p_value() for test in self._tests}
+
+
+def test_stream(
+    chunks: Iterable[NDArray[np.int64]], low: int, high: int
+) -> dict[str, float]:
+    battery = Battery(low, high)
+    for chunk in chunks:
+        battery.update(chunk)
+    return battery.report()
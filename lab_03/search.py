@@ -0,0 +1,267 @@
+import heapq
+import json
+import math
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import count
+from pathlib import Path
+from random import Random
+
+from algs import LcgParameters, approve_sequence
+from lcg import DEFAULT_PARAMETERS, LinearCongruentialGenerator
+
+BEST_PATH = Path(__file__).with_name("lcg_best.json")
+TOP_COUNT = 10
+DIMENSIONS = 6
+SEQUENCE_LENGTH = 1000
+CHUNK_SIZE = 64
+LLL_DELTA = 0.99
+# consecutive unusable moduli before the range is given up on
+MAX_MISSES = 1000
+
+# Hermite constants gamma_t^t for t = 2..8 (Knuth, TAOCP 3.3.4)
+_HERMITE_POWER = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+Parameters = tuple[int, int, int]
+
+
+@cache
+def _prime_factors(n: int) -> frozenset[int]:
+    factors = set()
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            factors.add(p)
+            n //= p
+        p += 1
+    if n > 1:
+        factors.add(n)
+    return frozenset(factors)
+
+
+def full_period(m: int, a: int, c: int) -> bool:
+    # Hull-Dobell theorem
+    if math.gcd(c, m) != 1:
+        return False
+    if any((a - 1) % p for p in _prime_factors(m)):
+        return False
+    return m % 4 != 0 or (a - 1) % 4 == 0
+
+
+def _gram_schmidt(
+    basis: list[list[int]],
+) -> tuple[list[list[float]], list[float]]:
+    dim = len(basis)
+    ortho: list[list[float]] = []
+    mu = [[0.0] * dim for _ in range(dim)]
+    norms: list[float] = []
+    for i, vec in enumerate(basis):
+        cur = [float(x) for x in vec]
+        for j in range(i):
+            mu[i][j] = sum(x * y for x, y in zip(vec, ortho[j])) / norms[j]
+            cur = [x - mu[i][j] * y for x, y in zip(cur, ortho[j])]
+        ortho.append(cur)
+        norms.append(sum(x * x for x in cur))
+    return mu, norms
+
+
+def _lll(basis: list[list[int]]) -> list[list[int]]:
+    basis = [vec[:] for vec in basis]
+    k = 1
+    while k < len(basis):
+        for j in range(k - 1, -1, -1):
+            mu, _ = _gram_schmidt(basis)
+            q = round(mu[k][j])
+            if q:
+                basis[k] = [x - q * y for x, y in zip(basis[k], basis[j])]
+
+        mu, norms = _gram_schmidt(basis)
+        if norms[k] >= (LLL_DELTA - mu[k][k - 1] ** 2) * norms[k - 1]:
+            k += 1
+        else:
+            basis[k], basis[k - 1] = basis[k - 1], basis[k]
+            k = max(k - 1, 1)
+    return basis
+
+
+def _shortest_norm(basis: list[list[int]]) -> int:
+    dim = len(basis)
+    mu, norms = _gram_schmidt(basis)
+    best = min(sum(x * x for x in vec) for vec in basis)
+    coeffs = [0] * dim
+
+    # Fincke-Pohst enumeration of all lattice points shorter than best
+    def search(k: int, partial: float) -> None:
+        nonlocal best
+        center = -sum(coeffs[j] * mu[j][k] for j in range(k + 1, dim))
+        radius = math.sqrt(max(best - partial, 0.0) / norms[k])
+        for coeff in range(
+            math.ceil(center - radius), math.floor(center + radius) + 1
+        ):
+            dist = partial + (coeff - center) ** 2 * norms[k]
+            if dist > best * (1 + 1e-9):
+                continue
+
+            coeffs[k] = coeff
+            if k:
+                search(k - 1, dist)
+            elif any(coeffs):
+                vec = [
+                    sum(c * basis[i][col] for i, c in enumerate(coeffs))
+                    for col in range(dim)
+                ]
+                best = min(best, sum(x * x for x in vec))
+        coeffs[k] = 0
+
+    search(dim - 1, 0.0)
+    return best
+
+
+def spectral_test(
+    m: int, a: int, dimensions: int = DIMENSIONS
+) -> dict[int, float]:
+    merits = {}
+    for dim in range(2, dimensions + 1):
+        # dual lattice: x_1 + a x_2 + ... + a^(t-1) x_t = 0 (mod m)
+        basis = [[m] + [0] * (dim - 1)]
+        for j in range(1, dim):
+            row = [0] * dim
+            row[0] = -pow(a, j, m)
+            row[j] = 1
+            basis.append(row)
+
+        nu = math.sqrt(_shortest_norm(_lll(basis)))
+        merits[dim] = nu / (
+            _HERMITE_POWER[dim] ** (1 / (2 * dim)) * m ** (1 / dim)
+        )
+    return merits
+
+
+def evaluate(
+    params: Parameters, dimensions: int = DIMENSIONS
+) -> dict[str, object]:
+    m, a, c = params
+    merits = spectral_test(m, a, dimensions)
+
+    generator = LinearCongruentialGenerator(m, a, c, 0)
+    factor = approve_sequence(generator.generate(SEQUENCE_LENGTH, 0, 10))
+
+    return {
+        "m": m,
+        "a": a,
+        "c": c,
+        "full_period": full_period(m, a, c),
+        "merit": min(merits.values()),
+        "merits": merits,
+        "factor": factor,
+    }
+
+
+def _score(result: dict[str, object]) -> tuple:
+    return (result["full_period"], result["merit"], result["factor"])
+
+
+def iter_candidates(
+    candidates: int, m_low: int, m_high: int, seed: int | None = None
+) -> Iterator[Parameters]:
+    rng = Random(seed)
+    produced = 0
+    misses = 0
+    while produced < candidates:
+        m = rng.randint(m_low, m_high)
+
+        # draw a and c so that Hull-Dobell holds by construction
+        step = math.prod(_prime_factors(m))
+        if m % 4 == 0:
+            step = math.lcm(step, 4)
+        if step >= m - 1:
+            # squarefree moduli only allow the multiplier a = 1
+            misses += 1
+            if misses >= MAX_MISSES:
+                raise ValueError(
+                    f"no full-period multiplier a > 1 found for moduli in "
+                    f"[{m_low}, {m_high}]; the range needs moduli with a "
+                    f"repeated prime factor"
+                )
+            continue
+
+        misses = 0
+
+        a = 1 + step * rng.randint(1, (m - 2) // step)
+        c = rng.randrange(1, m)
+        while math.gcd(c, m) != 1:
+            c = rng.randrange(1, m)
+
+        produced += 1
+        yield m, a, c
+
+
+def load_best(path: Path = BEST_PATH) -> list[dict[str, object]]:
+    if not Path(path).exists():
+        return []
+
+    with open(path) as file:
+        results = json.load(file)
+    for result in results:
+        result["merits"] = {int(k): v for k, v in result["merits"].items()}
+    return results
+
+
+def best_parameters(path: Path = BEST_PATH) -> LcgParameters:
+    best = load_best(path)
+    if not best:
+        raise ValueError(f"No saved LCG parameters in {path}")
+
+    m, a, c = best[0]["m"], best[0]["a"], best[0]["c"]
+    return m, a, c, DEFAULT_PARAMETERS[3] % m
+
+
+def save_best(results: list[dict[str, object]], path: Path = BEST_PATH) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def search(
+    candidates: int,
+    m_low: int,
+    m_high: int,
+    top: int = TOP_COUNT,
+    seed: int | None = None,
+    workers: int | None = None,
+    path: Path | None = BEST_PATH,
+) -> list[dict[str, object]]:
+    heap: list[tuple[tuple, int, dict[str, object]]] = []
+    seen: set[Parameters] = set()
+    order = count()
+
+    def push(result: dict[str, object]) -> None:
+        params = (result["m"], result["a"], result["c"])
+        if params in seen:
+            return
+        seen.add(params)
+
+        # the running index breaks ties so results are never compared
+        entry = (_score(result), next(order), result)
+        if len(heap) < top:
+            heapq.heappush(heap, entry)
+        elif entry[0] > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+
+    if path is not None:
+        for result in load_best(path):
+            push(result)
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for result in pool.map(
+            evaluate,
+            iter_candidates(candidates, m_low, m_high, seed),
+            chunksize=CHUNK_SIZE,
+        ):
+            push(result)
+
+    best = [result for _, _, result in sorted(heap, reverse=True)]
+    if path is not None:
+        save_best(best, path)
+    return best
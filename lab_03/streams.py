@@ -0,0 +1,116 @@
+import os
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from prng import PseudoRandomGenerator
+
+# bytes per buffered write and per chunk read back from a mapped file
+CHUNK_SIZE = 1 << 23
+FORMATS = ("bytes", "digits")
+# "table" is digit text whose first column labels each line, as in table.txt
+READ_FORMATS = (*FORMATS, "table")
+# value range of each format, as seen by approve_sequence and Battery
+RANGES = {"bytes": (0, 256), "digits": (0, 10), "table": (0, 10)}
+
+_ZERO = ord("0")
+_NEWLINE = ord("\n")
+_BLANKS = (ord(" "), ord("\t"))
+
+
+def random_bytes(
+    generator: PseudoRandomGenerator, size: int
+) -> NDArray[np.uint8]:
+    bits = generator.raw_range.bit_length() - 1
+    if generator.raw_range == 1 << bits and bits in (8, 16, 32, 64):
+        # whole words of a power-of-two generator are already uniform bytes
+        width = bits // 8
+        words = generator.random_raw(-(-size // width))
+        return words.astype(f"<u{width}", copy=False).view(np.uint8)[:size]
+
+    return generator.generate(size, 0, 256).astype(np.uint8)
+
+
+def random_digits(
+    generator: PseudoRandomGenerator, size: int
+) -> NDArray[np.uint8]:
+    return (generator.generate(size, 0, 10) + _ZERO).astype(np.uint8)
+
+
+def write_stream(
+    generator: PseudoRandomGenerator,
+    size: int,
+    file: BinaryIO,
+    fmt: str = "bytes",
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    produce = random_bytes if fmt == "bytes" else random_digits
+    for start in range(0, size, chunk_size):
+        chunk = produce(generator, min(chunk_size, size - start))
+        file.write(memoryview(chunk))
+    file.flush()
+
+
+def map_file(path: str) -> NDArray[np.uint8]:
+    # mmap refuses empty files
+    if not os.path.getsize(path):
+        return np.empty(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def guess_format(path: str) -> str:
+    if not path.endswith(".txt"):
+        return "bytes"
+
+    # table.txt-style files have a label and several groups on each line;
+    # digit streams written by write_stream are one unbroken run
+    with open(path, "rb") as file:
+        first_line = file.readline(1 << 16)
+    return "table" if len(first_line.split()) > 1 else "digits"
+
+
+def _label_mask(
+    chunk: NDArray[np.uint8], in_label: bool
+) -> tuple[NDArray[np.bool_], bool]:
+    # a byte belongs to the label column while no blank has been seen since
+    # the start of its line; in_label carries that over chunk boundaries
+    newline = chunk == _NEWLINE
+    seen = np.cumsum(np.isin(chunk, _BLANKS))
+    base = np.maximum.accumulate(np.where(newline, seen, 0 if in_label else -1))
+    label = seen == base
+    return label, bool(label[-1])
+
+
+def iter_values(
+    mapped: NDArray[np.uint8], fmt: str = "bytes", chunk_size: int = CHUNK_SIZE
+) -> Iterator[NDArray[np.int64]]:
+    in_label = True
+    # the mapping is sliced lazily, so only one widened chunk is resident
+    for start in range(0, len(mapped), chunk_size):
+        chunk = mapped[start : start + chunk_size]
+        if fmt != "bytes":
+            # every other byte (spaces, line breaks) is a separator
+            keep = (chunk >= _ZERO) & (chunk <= _ZERO + 9)
+            if fmt == "table":
+                label, in_label = _label_mask(chunk, in_label)
+                keep &= ~label
+            chunk = chunk[keep] - _ZERO
+        yield chunk.astype(np.int64)
+
+
+def read_values(
+    mapped: NDArray[np.uint8], fmt: str = "bytes", count: int | None = None
+) -> NDArray[np.integer]:
+    if fmt == "bytes":
+        # a view of the mapping; approve_sequence widens it itself
+        return mapped[:count]
+
+    chunks, total = [], 0
+    for chunk in iter_values(mapped, fmt):
+        chunks.append(chunk)
+        total += len(chunk)
+        if count is not None and total >= count:
+            break
+    return np.concatenate(chunks or [np.empty(0, dtype=np.int64)])[:count]
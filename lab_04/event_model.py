@@ -1,5 +1,7 @@
+import heapq
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import count
 from random import randint
 
 from distributions import IGenerator, IProcessor
@@ -16,25 +18,55 @@ class Event:
     type: EventType
 
 
+@dataclass(slots=True)
+class ScheduledEvent:
+    event: Event
+    pending: bool = True
+
+
 class EventsFlow:
     def __init__(self, init_data: list[Event] | None = None) -> None:
-        self._items: list[Event] = []
+        # heap of (time, insertion number, handle): simultaneous events
+        # leave in insertion order and handles are never compared
+        self._heap: list[tuple[float, int, ScheduledEvent]] = []
+        self._order = count()
+        self._cancelled = 0
         if init_data:
-            self._items.extend(init_data)
-
-    def add(self, event: Event) -> None:
-        pos = 0
-
-        while pos < len(self._items) and event.time > self._items[pos].time:
-            pos += 1
-
-        if pos < len(self._items):
-            self._items.insert(pos - 1, event)
-        else:
-            self._items.append(event)
+            self._heap = [
+                (event.time, next(self._order), ScheduledEvent(event))
+                for event in init_data
+            ]
+            heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def add(self, event: Event) -> ScheduledEvent:
+        handle = ScheduledEvent(event)
+        heapq.heappush(self._heap, (event.time, next(self._order), handle))
+        return handle
+
+    def cancel(self, handle: ScheduledEvent) -> None:
+        if not handle.pending:
+            return
+        handle.pending = False
+        self._cancelled += 1
+
+        # cancelled entries stay in the heap until popped; rebuild once
+        # they make up most of it
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [item for item in self._heap if item[2].pending]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
 
     def get(self) -> Event:
-        return self._items.pop(0)
+        while self._heap:
+            _, _, handle = heapq.heappop(self._heap)
+            if handle.pending:
+                handle.pending = False
+                return handle.event
+            self._cancelled -= 1
+        raise IndexError("get from an empty events flow")
 
 
 class EventModel: